@@ -1 +1,6 @@
-from scythe.version import __version__   # noqa: F401
+def __getattr__(name):
+    # defer the (comparatively slow) version lookup until someone asks for it
+    if name == '__version__':
+        from scythe.version import __version__
+        return __version__
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -2,12 +2,26 @@
 
 import json
 from abc import abstractmethod
-from typing import Any, Union
+from base64 import b64encode
+from functools import lru_cache
+from typing import Any, Optional, Union
 
 import numpy as np
+from packaging.version import Version
 
 from scythe.base import BaseExtractor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Version:
+    """Parse a (PEP 440) version string, reusing earlier results"""
+    return Version(version)
+
 
 class BaseAdapter:
     """Template for tools that transform metadata into a new form"""
@@ -33,12 +47,11 @@ class BaseAdapter:
             (bool) Whether this parser is compatible
         """
 
-        if self.version() is None:
+        my_version = self.version()
+        if my_version is None:
             return True
         else:
-            my_version = tuple(int(x) for x in self.version().split('.'))
-            their_version = tuple(int(x) for x in parser.version().split('.'))
-            return my_version == their_version
+            return _parse_version(my_version) == _parse_version(parser.version())
 
     def version(self) -> Union[None, str]:
         """Version of the parser that an adapter was created for
@@ -62,15 +75,64 @@ class NOOPAdapter(BaseAdapter):
 class SerializeAdapter(BaseAdapter):
     """Converts the metadata to a string by serializing with JSON"""
 
+    def __init__(self, compact: bool = False):
+        """
+        Args:
+            compact (bool): Whether to write JSON without whitespace. Compact output is
+                produced with `orjson <https://github.com/ijl/orjson>`_ if it is installed,
+                which is much faster for large metadata records. The output then differs from
+                that of the standard library for some values: NaN and infinities are written as
+                ``null`` rather than ``NaN`` and ``Infinity``, and NumPy floats are written at
+                their own precision (e.g., ``np.float32(0.1)`` as ``0.1`` rather than
+                ``0.10000000149011612``). Records that orjson cannot serialize, such as those
+                with integers beyond 64 bits, are written with the standard library
+        """
+        self.compact = compact
+
+    def _dumps(self, metadata: dict, default=None, native_numpy: bool = True) -> str:
+        if self.compact:
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS
+                if native_numpy:
+                    option |= orjson.OPT_SERIALIZE_NUMPY
+                try:
+                    return orjson.dumps(metadata, default=default, option=option).decode()
+                except orjson.JSONEncodeError:
+                    # orjson is stricter than the standard library, so give the record a second
+                    #  chance rather than failing
+                    pass
+            return json.dumps(metadata, default=default, separators=(',', ':'))
+        return json.dumps(metadata, default=default)
+
     def transform(self, metadata: dict, context=None) -> str:
-        return json.dumps(metadata)
+        return self._dumps(metadata)
 
 
-class GreedySerializeAdapter(BaseAdapter):
+class GreedySerializeAdapter(SerializeAdapter):
     """Converts the metadata to a string by serializing with JSON, making some (hopefully) informed
     choices about what to do with various types commonly seen, and otherwise reporting that the
     data type could not be serialized. May not work in all situations, but should cover a large
     number of cases."""
+
+    def __init__(self, compact: bool = False, max_list_size: Optional[int] = None):
+        """
+        Args:
+            compact (bool): Whether to write JSON without whitespace
+            max_list_size (int): Numeric arrays with more elements than this are written as
+                ``{"__ndarray__": <base64 of the raw bytes>, "dtype": ..., "shape": ...}``
+                rather than as (much larger and slower to build) nested lists. By default,
+                all arrays are written as lists. Decode with
+                ``np.frombuffer(b64decode(x["__ndarray__"]), x["dtype"]).reshape(x["shape"])``
+        """
+        super().__init__(compact=compact)
+        self.max_list_size = max_list_size
+
+    def _default(self, o):
+        if isinstance(o, np.ndarray) and o.size > self.max_list_size and o.dtype.kind in 'biufc':
+            return {'__ndarray__': b64encode(o.tobytes()).decode('ascii'),
+                    'dtype': o.dtype.str, 'shape': list(o.shape)}
+        return GreedySerializeAdapter.default(o)
+
     @staticmethod
     def default(o):
         success = False
@@ -89,5 +151,8 @@ class GreedySerializeAdapter(BaseAdapter):
             return f"<<Unserializable type: {type_name}>>"
 
     def transform(self, metadata: dict, context=None) -> str:
-        s = json.dumps(metadata, default=GreedySerializeAdapter.default)
+        if self.max_list_size is None:
+            s = self._dumps(metadata, default=GreedySerializeAdapter.default)
+        else:
+            s = self._dumps(metadata, default=self._default, native_numpy=False)
         return s
@@ -1,8 +1,10 @@
-import json
+import os
 import datetime
+import warnings
 from ase.io.jsonio import create_ndarray
-from ase.io import read, write
-from io import StringIO
+from ase.db.row import AtomsRow
+from ase.db.core import now
+from ase.io import read
 import numpy as np
 
 from scythe.base import BaseSingleFileExtractor
@@ -16,9 +18,16 @@ def object_hook(dct):
 
     Adapted from ase.io.jsonio
 
+    .. deprecated:: 0.1.1
+        The extractor builds records from ASE database rows directly and no longer decodes
+        ASE JSON, so this function is unused and will be removed
+
     Args:
         dct (dict): Dictionary to reconstitute to an ASE object
     """
+    warnings.warn('scythe.ase.object_hook is no longer used by the extractor and will be removed',
+                  DeprecationWarning, stacklevel=2)
+
     if '__datetime__' in dct:
         return datetime.datetime.strptime(dct['__datetime__'], '%Y-%m-%dT%H:%M:%S.%f')
 
@@ -36,6 +45,31 @@ def object_hook(dct):
     return dct
 
 
+def _to_record(value):
+    """Convert a value from an ASE database row to the types used in the extracted record
+
+    Mirrors how ASE encodes the value in its JSON DB format (objects with a ``todict`` method
+    become dictionaries, numpy scalars become Python scalars), except that arrays become lists
+
+    Args:
+        value: Value to convert
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, 'todict'):
+        dct = {k: _to_record(v) for k, v in value.todict().items()}
+        if hasattr(value, 'ase_objtype'):
+            dct['__ase_objtype__'] = value.ase_objtype
+        return dct
+    if isinstance(value, dict):
+        return {k: _to_record(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_record(v) for v in value]
+    return value
+
+
 class ASEExtractor(BaseSingleFileExtractor):
     """Parse information from atomistic simulation input files using ASE.
 
@@ -46,17 +80,23 @@ class ASEExtractor(BaseSingleFileExtractor):
 
     def _extract_file(self, path, context=None):
         # Attempt to read the file with ASE
-        # To return ASE JSON DB requires writing to file.
-        # Here we use StringIO instead of a file on disk.
-
-        fobj = StringIO()
         m = read(path)
-        write(images=m, format="json", filename=fobj)
-        js = json.loads(fobj.getvalue(), object_hook=object_hook)
 
-        # Select the first record.
-        # TODO: Test this against multiple records
-        record = js['1']
+        # Build the record as the ASE JSON DB would store it, without writing and
+        #  re-parsing the JSON text
+        row = AtomsRow(m)
+        row.ctime = now()
+        row.user = os.getenv('USER')
+        record = {}
+        for key, value in row.__dict__.items():
+            if key[0] == '_' or key == 'id':
+                continue
+            record[key] = _to_record(value)
+        record['mtime'] = row.ctime
+        constraints = row.get('constraints')
+        if constraints:
+            record['constraints'] = _to_record(constraints)
+
         record['chemical_formula'] = m.get_chemical_formula()
         return record
 
@@ -1,12 +1,20 @@
-from typing import List, Iterator, Tuple, Iterable, Union, Sequence
+from typing import List, Iterator, Tuple, Iterable, Union, Sequence, Optional
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice, repeat
 import logging
+import pickle
+import copy
 import os
 
 from scythe.utils.grouping import preprocess_paths
 
 logger = logging.getLogger(__name__)
 
+# Groups submitted to each thread of extract_directory ahead of the results being consumed
+_GROUPS_PER_THREAD = 4
+
 
 class BaseExtractor(ABC):
     """Abstract base class for a metadata extractor
@@ -33,18 +41,38 @@ class BaseExtractor(ABC):
             ([str]) Groups of eligible files
         """
 
-        # Walk through the directories
-        for root, dirs, files in os.walk(path):
-            # Generate the full paths
-            dirs = [os.path.join(root, d) for d in dirs]
-            files = [os.path.join(root, f) for f in files]
+        # Walk through the directories, top-down and depth-first like os.walk. Scanning directly
+        #  gives the full path of each entry and reuses the file type read with the listing
+        to_walk = [path]
+        while len(to_walk) > 0:
+            root = to_walk.pop()
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            dirs, files, subdirs = [], [], []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(entry.path)
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    files.append(entry.path)
 
             # Get any groups from this directory
             for group in self.group(files, dirs, context):
                 yield group
 
-    def extract_directory(self, path: str, context: dict = None) -> \
-            Iterator[Tuple[Tuple[str], dict]]:
+            to_walk.extend(reversed(subdirs))
+
+    def extract_directory(self, path: str, context: dict = None, max_workers: int = None,
+                          use_processes: bool = False) -> Iterator[Tuple[Tuple[str], dict]]:
         """Run extractor on all appropriate files in a directory
 
         Skips files that throw exceptions while parsing
@@ -52,17 +80,92 @@ class BaseExtractor(ABC):
         Args:
             path (str): Root of directory to extract metadata from
             context (dict): Context about the files
+            max_workers (int): Number of workers used to extract groups concurrently.
+                By default, groups are extracted one at a time. Threads help most for
+                extractors that spend their time waiting on file I/O (e.g., reading image headers).
+                Each thread extracts using its own shallow copy of the extractor
+            use_processes (bool): Whether the workers should be processes rather than threads,
+                which suits CPU-bound extractors. All groups are then found before extraction
+                starts, and results are held until they are yielded in order, so memory use
+                grows with the number of groups. Each worker process has a fully independent
+                copy of the extractor. Falls back to threads if the extractor cannot be pickled.
+                Those threads extract each group with a shallow ``copy.copy`` of the extractor,
+                so attributes holding mutable objects are shared between threads
         Yields:
             ([str], dict): Tuple of the group identity and the metadata unit
         """
 
-        for group in self.identify_files(path, context):
+        groups = self.identify_files(path, context)
+        if max_workers is None:
+            for group in groups:
+                result = self._extract_group(group, context)
+                if result is not None:
+                    yield result
+            return
+
+        if use_processes:
             try:
-                metadata_unit = self.extract(group, context)
+                pickle.dumps(self)
             except Exception:
-                continue
+                logger.warning(f'{type(self).__name__} cannot be pickled. Using threads, each with '
+                               f'a shallow copy of the extractor, instead')
             else:
-                yield group, metadata_unit
+                # The executor submits every group before yielding any result, so list them first
+                #  and send each worker several groups per message to reduce the pickling and IPC
+                #  overhead for many small files
+                groups = list(groups)
+                chunksize = max(1, len(groups) // (max_workers * 4))
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for result in executor.map(self._extract_group, groups, repeat(context),
+                                               chunksize=chunksize):
+                        if result is not None:
+                            yield result
+                return
+
+        # Only keep a few groups per thread in flight, so that the directory is still walked
+        #  lazily and finished results do not pile up ahead of the consumer
+        groups = iter(groups)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Extractors may keep per-file state on the instance, so each thread works on a copy
+            pending = deque(executor.submit(self._extract_group_on_copy, group, context)
+                            for group in islice(groups, max_workers * _GROUPS_PER_THREAD))
+            while pending:
+                result = pending.popleft().result()
+                for group in islice(groups, 1):
+                    pending.append(executor.submit(self._extract_group_on_copy, group, context))
+                if result is not None:
+                    yield result
+
+    def _extract_group(self, group: Tuple[str], context: dict = None) -> \
+            Optional[Tuple[Tuple[str], dict]]:
+        """Extract metadata from a group, returning ``None`` if the extractor fails
+
+        Args:
+            group ([str]): Group of files to parse
+            context (dict): Context about the files
+        Returns:
+            ([str], dict): Tuple of the group identity and the metadata unit
+        """
+        try:
+            metadata_unit = self.extract(group, context)
+        except Exception:
+            return None
+        return group, metadata_unit
+
+    def _extract_group_on_copy(self, group: Tuple[str], context: dict = None) -> \
+            Optional[Tuple[Tuple[str], dict]]:
+        """Extract metadata from a group using a shallow copy of this extractor
+
+        Lets threads share an extractor that stores the state of the file being parsed in
+        its attributes without mixing the results of different files
+
+        Args:
+            group ([str]): Group of files to parse
+            context (dict): Context about the files
+        Returns:
+            ([str], dict): Tuple of the group identity and the metadata unit
+        """
+        return copy.copy(self)._extract_group(group, context)
 
     @abstractmethod
     def extract(self, group: Iterable[str], context: dict = None) -> dict:
@@ -158,8 +261,10 @@ class BaseSingleFileExtractor(BaseExtractor):
         if isinstance(group, str):
             return self._extract_file(group, context)
 
-        # Assumes that the group must have exactly one file
-        if len(group) > 1:
+        # Assumes that the group must have exactly one file. Unpacking checks that and
+        #  retrieves the path in a single step
+        try:
+            path, = group
+        except ValueError:
             raise ValueError('Extractor only takes a single file at a time')
-
-        return self._extract_file(group[0], context)
+        return self._extract_file(path, context)
@@ -1,9 +1,66 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+
 from pymatgen.io.ase import AseAtomsAdaptor
 from pymatgen.core import Structure
 from ase.io import read
+import numpy as np
+import spglib
 
 from scythe.base import BaseSingleFileExtractor
 
+# Tolerances used by pymatgen's ``get_space_group_info``
+_SYMPREC = 0.01
+_ANGLE_TOLERANCE = 5.0
+
+
+@lru_cache(maxsize=64)
+def _find_space_group_number(lattice: bytes, positions: bytes,
+                             numbers: Tuple[int, ...]) -> Optional[int]:
+    """Run the spglib symmetry search, reusing the result for identical structures
+
+    Args:
+        lattice: Lattice vectors as the bytes of a 3x3 float64 array
+        positions: Fractional coordinates as the bytes of an Nx3 float64 array
+        numbers: Integer label of the species on each site
+    Returns:
+        Space group number, or ``None`` if the search failed
+    """
+    cell = (np.frombuffer(lattice).reshape(3, 3),
+            np.frombuffer(positions).reshape(-1, 3),
+            numbers)
+    dataset = spglib.get_symmetry_dataset(cell, symprec=_SYMPREC,
+                                          angle_tolerance=_ANGLE_TOLERANCE)
+    if dataset is None:
+        return None
+    return dataset.number if hasattr(dataset, 'number') else dataset['number']
+
+
+def _get_space_group_number(structure: Structure) -> int:
+    """Get the space group number of a structure
+
+    Calls spglib directly with the same cell and tolerances pymatgen would use, which avoids
+    building a ``SpacegroupAnalyzer`` and lets repeated structures reuse an earlier result
+
+    Args:
+        structure: Structure to be analyzed
+    Returns:
+        Space group number
+    """
+    # pymatgen also passes magnetic moments to spglib, so leave those structures to it
+    if 'magmom' in structure.site_properties:
+        return structure.get_space_group_info(_SYMPREC, _ANGLE_TOLERANCE)[1]
+
+    # Label each distinct species (including oxidation states) in order of appearance
+    labels = {}
+    numbers = tuple(labels.setdefault(site.species, len(labels) + 1) for site in structure)
+    lattice = np.ascontiguousarray(structure.lattice.matrix, dtype=np.float64)
+    positions = np.ascontiguousarray(structure.frac_coords, dtype=np.float64)
+    number = _find_space_group_number(lattice.tobytes(), positions.tobytes(), numbers)
+    if number is None:
+        return structure.get_space_group_info(_SYMPREC, _ANGLE_TOLERANCE)[1]
+    return number
+
 
 class CrystalStructureExtractor(BaseSingleFileExtractor):
     """Extract information about a crystal structure from many types of files.
@@ -11,8 +68,6 @@ class CrystalStructureExtractor(BaseSingleFileExtractor):
      Uses either ASE or Pymatgen on the back end"""
 
     def _extract_file(self, path, context=None):
-        material = {}
-        crystal_structure = {}
         # Attempt to read the file
         try:
             # Read with ASE
@@ -32,21 +87,21 @@ class CrystalStructureExtractor(BaseSingleFileExtractor):
                 # Can't read file
                 raise ValueError('File not readable by pymatgen or ase: {}'.format(path))
 
-        # Parse material block
-        material["composition"] = pmg_s.formula.replace(" ", "")
-
-        # Parse crystal_structure block
-        crystal_structure["space_group_number"] = pmg_s.get_space_group_info()[1]
-        crystal_structure["number_of_atoms"] = float(pmg_s.composition.num_atoms)
-        crystal_structure["volume"] = float(pmg_s.volume)
-        crystal_structure["stoichiometry"] = pmg_s.composition.anonymized_formula
-
-        record = {}
-        if material:
-            record["material"] = material
-        if crystal_structure:
-            record["crystal_structure"] = crystal_structure
-        return record
+        # The composition is rebuilt from every site each time it is accessed, so get it once
+        composition = pmg_s.composition
+
+        # Both blocks are always populated, so build the record in one step
+        return {
+            "material": {
+                "composition": composition.formula.replace(" ", "")
+            },
+            "crystal_structure": {
+                "space_group_number": _get_space_group_number(pmg_s),
+                "number_of_atoms": float(composition.num_atoms),
+                "volume": float(pmg_s.volume),
+                "stoichiometry": composition.anonymized_formula
+            }
+        }
 
     def implementors(self):
         return ['Jonathon Gaff']
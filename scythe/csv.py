@@ -7,6 +7,25 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _geopoint_to_list(point) -> List[float]:
+    return [float(point[0]), float(point[1])]
+
+
+def _isoformat(value) -> str:
+    return value.isoformat()
+
+
+# Functions that turn the values tableschema casts each field type into JSON-compatible ones.
+#  Types that are not listed already cast to plain Python types
+_FIELD_CONVERTERS = {
+    'geopoint': _geopoint_to_list,
+    'number': float,
+    'date': _isoformat,
+    'datetime': _isoformat,
+    'time': _isoformat,
+}
+
+
 class CSVExtractor(BaseSingleFileExtractor):
     """Describe the contents of a comma-separated value (CSV) file
 
@@ -49,18 +68,27 @@ class CSVExtractor(BaseSingleFileExtractor):
 
         # If desired, store the data
         if self.return_records:
+            # resolve everything used per row once, outside of the row loop
             headers = table.schema.headers
+            cast_row = table.schema.cast_row
+            converters = [_FIELD_CONVERTERS.get(f.type) for f in table.schema.fields]
             records = []
             failed_records = 0
             for row in table.iter(keyed=False, cast=False):
                 try:
-                    row = table.schema.cast_row(row)
+                    row = cast_row(row)
                 except CastError:
+                    # rows that fail casting are kept as the raw strings
                     failed_records += 1
+                    records.append(dict(zip(headers, row)))
+                    continue
 
                 # TODO (wardlt): Use json output from tableschema once it's supported
                 #  https://github.com/frictionlessdata/tableschema-py/issues/213
-                records.append(eval(repr(dict(zip(headers, row)))))
+                records.append({
+                    h: v if c is None or v is None else c(v)
+                    for h, c, v in zip(headers, converters, row)
+                })
             if failed_records > 0:
                 logger.warning(f'{failed_records} records failed casting with schema')
             output['records'] = records
@@ -2,14 +2,13 @@ from typing import Union, Iterable, Tuple, List
 from scythe.utils.grouping import preprocess_paths, group_by_postfix
 from scythe.base import BaseExtractor
 from dfttopif import files_to_pif
-from operator import itemgetter
-import itertools
+from collections import defaultdict
 import os
 
 
 # List of files that are known to the VASP parser
-_vasp_file_names = ["outcar", "incar", "chgcar", "wavecar", "wavcar", "oszicar", "ibzcar",
-                    "kpoints", "doscar", "poscar", "contcar", "vasp_run.xml", "xdatcar"]
+_VASP_FILE_NAMES = ("outcar", "incar", "chgcar", "wavecar", "wavcar", "oszicar", "ibzcar",
+                    "kpoints", "doscar", "poscar", "contcar", "vasp_run.xml", "xdatcar")
 
 
 class DFTExtractor(BaseExtractor):
@@ -52,7 +51,7 @@ class DFTExtractor(BaseExtractor):
             ((files)): List of VASP files from the same calculation
         """
 
-        for group in group_by_postfix(files, _vasp_file_names):
+        for group in group_by_postfix(files, _VASP_FILE_NAMES):
             yield group
 
     def _group_pwscf(self, files: Iterable[str]) -> Iterable[Tuple[str, ...]]:
@@ -67,9 +66,12 @@ class DFTExtractor(BaseExtractor):
         # For now, we just group files by directory
         #  TODO (lw): Find files that have PWSCF flags in them
         #  TODO (lw): Read PWSCF input files to know the save directory
-        file_and_dir = [(os.path.dirname(f), f) for f in files]
-        for k, group in itertools.groupby(sorted(file_and_dir), key=itemgetter(0)):
-            yield [x[1] for x in group]
+        by_dir = defaultdict(list)
+        for f in files:
+            by_dir[os.path.dirname(f)].append(f)
+        for d in sorted(by_dir):
+            # ``files`` may be a set, so sort to keep the groups in a reproducible order
+            yield sorted(by_dir[d])
 
     def extract(self, group: Iterable[str], context: dict = None):
         return files_to_pif(group, quality_report=self.quality_report).as_dictionary()
@@ -1,10 +1,15 @@
 import logging
+import os
 import re
-import json
 import pathlib
-from typing import Tuple, Dict, Optional
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, \
+    Pattern, Tuple, Union
 
 from hyperspy.io import load as hs_load
+from hyperspy.io_plugins import io_plugins
+from hyperspy.misc.utils import DictionaryTreeBrowser, slugify
 from traits.trait_base import Undefined
 
 from scythe.base import BaseSingleFileExtractor
@@ -16,6 +21,453 @@ from scythe.utils import set_nested_dict_value_with_units as set_val_units
 logger = logging.getLogger(__name__)
 
 
+def _div_1000(x: float) -> float:
+    """Scale a value down by a factor of 1000 (e.g., from micrometers to millimeters)"""
+    return x / 1000
+
+
+def _times_1000(x: float) -> float:
+    """Scale a value up by a factor of 1000 (e.g., from meters to millimeters)"""
+    return x * 1000
+
+
+def _strip_mm(x: str) -> float:
+    """Read a size given with a "mm" suffix (such as an aperture label) as a float"""
+    return float(x.replace('mm', ''))
+
+
+def _nonzero_float(x) -> Optional[float]:
+    """Cast a value to float, treating a zero reading (FEI's "not recorded") as missing"""
+    return float(x) if x else None
+
+
+class _MappingSpec(NamedTuple):
+    """The static part of a :class:`~scythe.utils.MappingElements`, i.e. everything but the
+    source and destination dictionaries, so that mapping tables can be defined once at import
+    and bound to the dictionaries of each file with :func:`_bind`"""
+    source_path: Union[str, Tuple[str, ...]]
+    dest_path: Tuple[str, ...]
+    cast_fn: Optional[Callable] = None
+    units: Optional[str] = None
+    conv_fn: Optional[Callable] = None
+    override: bool = False
+
+
+def _bind(specs: Iterable[_MappingSpec], source_dict: Mapping,
+          dest_dict: Dict) -> List[MappingElements]:
+    """Create the mapping elements for a table of specs from one source into one destination"""
+    return [MappingElements(source_dict=source_dict, source_path=spec.source_path,
+                            dest_dict=dest_dict, dest_path=spec.dest_path,
+                            cast_fn=spec.cast_fn, units=spec.units, conv_fn=spec.conv_fn,
+                            override=spec.override)
+            for spec in specs]
+
+
+# values in HyperSpy's ``Acquisition_instrument.<SEM|TEM>`` node
+_HS_INSTRUMENT_SPECS = (
+    _MappingSpec('acquisition_mode', ('General_EM', 'acquisition_mode'), str),
+    _MappingSpec('beam_current', ('General_EM', 'beam_current'), float, 'NanoA'),
+    _MappingSpec('beam_energy', ('General_EM', 'beam_energy'), float, 'KiloEV'),
+    _MappingSpec('convergence_angle', ('General_EM', 'convergence_angle'), float, 'MilliRAD'),
+    _MappingSpec('microscope', ('General_EM', 'microscope_name'), str),
+    _MappingSpec('probe_area', ('General_EM', 'probe_area'), float, 'NanoM2'),
+    # camera length/working distance
+    _MappingSpec('camera_length', ('TEM', 'camera_length'), float, 'MilliM'),
+    _MappingSpec('working_distance', ('SEM', 'working_distance'), float, 'MilliM'),
+)
+
+# values in the instrument's ``Stage`` node
+_HS_STAGE_SPECS = (
+    _MappingSpec('rotation', ('General_EM', 'stage_position', 'rotation'), float, 'DEG'),
+    _MappingSpec('tilt_alpha', ('General_EM', 'stage_position', 'tilt_alpha'), float, 'DEG'),
+    _MappingSpec('tilt_beta', ('General_EM', 'stage_position', 'tilt_beta'), float, 'DEG'),
+    _MappingSpec('x', ('General_EM', 'stage_position', 'x'), float, 'MilliM'),
+    _MappingSpec('y', ('General_EM', 'stage_position', 'y'), float, 'MilliM'),
+    _MappingSpec('z', ('General_EM', 'stage_position', 'z'), float, 'MilliM'),
+)
+
+# values at the top of HyperSpy's ``metadata`` tree
+_HS_GENERAL_SPECS = (
+    # Elements present (if known)
+    _MappingSpec(('Sample', 'elements'), ('General_EM', 'elements'), list),
+    # General metadata
+    _MappingSpec(('General', 'date'), ('General', 'date'), str),
+    _MappingSpec(('General', 'doi'), ('General', 'doi'), str),
+    _MappingSpec(('General', 'original_filename'), ('General', 'original_filename'), str),
+    _MappingSpec(('General', 'notes'), ('General', 'notes'), str),
+    _MappingSpec(('General', 'time'), ('General', 'time'), str),
+    _MappingSpec(('General', 'time_zone'), ('General', 'time_zone'), str),
+    _MappingSpec(('General', 'title'), ('General', 'title'), str),
+)
+
+_HS_DETECTOR_SPECS = (
+    _MappingSpec('detector_type', ('General_EM', 'detector_name'), str),
+)
+
+# values in the instrument's ``Detector.EDS`` node
+_HS_EDS_SPECS = (
+    _MappingSpec('azimuth_angle', ('EDS', 'azimuth_angle'), float, 'DEG'),
+    _MappingSpec('elevation_angle', ('EDS', 'elevation_angle'), float, 'DEG'),
+    _MappingSpec('energy_resolution_MnKa', ('EDS', 'energy_resolution_MnKa'), float, 'EV'),
+    _MappingSpec('live_time', ('EDS', 'live_time'), float, 'SEC'),
+    _MappingSpec('real_time', ('EDS', 'real_time'), float, 'SEC'),
+)
+
+# values in the instrument's ``Detector.EELS`` node
+_HS_EELS_SPECS = (
+    _MappingSpec('aperture_size', ('EELS', 'aperture_size'), float, 'MilliM'),
+    _MappingSpec('collection_angle', ('EELS', 'collection_angle'), float, 'MilliRAD'),
+    _MappingSpec('dwell_time', ('General_EM', 'dwell_time'), float, 'SEC'),
+    _MappingSpec('exposure', ('General_EM', 'exposure_time'), float, 'SEC'),
+    _MappingSpec('frame_number', ('EELS', 'number_of_samples'), int, 'NUM'),
+    _MappingSpec('spectrometer', ('EELS', 'spectrometer_name'), str),
+)
+
+
+# Patterns for the values in the Tecnai "Microscope Info" string of DM3 files
+_RE_EXTR_VOLT = re.compile(r'Extr volt (\d*) V')
+_RE_EMISSION = re.compile(r'Emission ([\d|\.]*)uA')
+_RE_OPERATION_MODE = re.compile(r'(.*) Defocus')
+# "Defocus (um) -0.000 Magn ..." in imaging mode, "Defocus 0.000 CL ..." in diffraction mode
+_RE_DEFOCUS = re.compile(r'Defocus (?:\(um\) )?(-?[\d.]+)')
+_RE_MAGN = re.compile(r'Magn (\d*)x')
+_RE_CL = re.compile(r'CL (.*)m')
+# x, y, z (in um) then alpha, beta (in deg), e.g. " 147.847 um, -132.289 um, 126.673 um, 0.65 deg,
+# 0.00 deg"
+_RE_STAGE = re.compile(r' (-?\d*\.\d*) um,? (-?\d*\.\d*) um,? (-?\d*\.\d*) um,?'
+                       r' (-?\d*\.\d*) deg,? (-?\d*\.\d*) deg')
+_RE_DISPERSION = re.compile(r'(.*)\[eV/Channel\]')
+_RE_APERTURE = re.compile(r'(\d*)mm')
+_RE_EV = re.compile(r'(.*)\[eV\]')
+
+# Strings that locate each line of interest in the Tecnai "Microscope Info" string. These are
+# not all line prefixes; e.g., the extractor voltage and emission are in the middle of the
+# line describing the gun
+_TECNAI_KEYS = ('Microscope ', 'Extr volt ', 'Emission ', 'Mode ', 'Spot ', 'Stage',
+                'Filter related settings', 'Mode: ', 'Selected dispersion: ',
+                'Selected aperture: ', 'Prism shift: ', 'Drift tube: ', 'Total energy loss: ')
+
+
+def _scan_tecnai_info(lines: List[str]) -> Dict[str, str]:
+    """Find the first line containing each of the ``_TECNAI_KEYS``, in a single pass
+
+    Args:
+        lines: Lines of the Tecnai "Microscope Info" string
+    Returns:
+        The matching line for each key that was found, with the key removed if the line
+        starts with it
+    """
+    found = {}
+    for line in lines:
+        for key in _TECNAI_KEYS:
+            if key not in found and key in line:
+                found[key] = line[len(key):] if line.startswith(key) else line
+    return found
+
+
+# values parsed out of the Tecnai "Microscope Info" string; we override existing values since
+# Tecnai info is more specific. Tecnai also has info about apertures and lens strengths, but we
+# do not extract those here (see NexusLIMS code for example)
+_TECNAI_SPECS = (
+    _MappingSpec('Microscope_Name', ('General_EM', 'microscope_name'), str, override=True),
+    _MappingSpec('Extractor_Voltage', ('TEM', 'extractor_voltage'), int, 'V', override=True),
+    _MappingSpec('Emission_Current', ('General_EM', 'emission_current'), float, 'MicroA',
+                 override=True),
+    _MappingSpec('Operation_Mode', ('TEM', 'operation_mode'), str, override=True),
+    _MappingSpec('Defocus', ('TEM', 'defocus'), float, 'MicroM', override=True),
+    _MappingSpec('Magnification', ('General_EM', 'magnification_indicated'), int, 'UNITLESS',
+                 override=True),
+    _MappingSpec('Camera_Length', ('TEM', 'camera_length'), float, 'MilliM', _times_1000,
+                 override=True),
+    _MappingSpec('Spot_Size', ('TEM', 'spot_size'), int, 'UNITLESS', override=True),
+    _MappingSpec('x', ('General_EM', 'stage_position', 'x'), float, 'MicroM', override=True),
+    _MappingSpec('y', ('General_EM', 'stage_position', 'y'), float, 'MicroM', override=True),
+    _MappingSpec('z', ('General_EM', 'stage_position', 'z'), float, 'MicroM', override=True),
+    _MappingSpec('a', ('General_EM', 'stage_position', 'tilt_alpha'), float, 'DEG',
+                 override=True),
+    _MappingSpec('b', ('General_EM', 'stage_position', 'tilt_beta'), float, 'DEG',
+                 override=True),
+    # EELS spectrometer info
+    _MappingSpec('Mode', ('EELS', 'spectrometer_mode'), str, override=True),
+    _MappingSpec('Dispersion', ('EELS', 'dispersion_per_channel'), float, 'EV', override=True),
+    _MappingSpec('Aperture', ('EELS', 'aperture_size'), float, 'MilliM', override=True),
+    _MappingSpec('Drift', ('EELS', 'drift_tube_energy'), float, 'EV', override=True),
+    _MappingSpec('Prism', ('EELS', 'prism_shift_energy'), float, 'EV', override=True),
+    _MappingSpec('TotalLoss', ('EELS', 'total_energy_loss'), float, 'EV', override=True),
+)
+
+
+# Zeiss SEM tifs give the magnification in thousands, as in "12.5 K X"
+_ZEISS_K_X = re.compile(r'\s*K\s*X\s*$')
+
+# File extensions (lower case, without the dot) that one of HyperSpy's readers claims
+_HS_EXTENSIONS = frozenset(ext.lower() for plugin in io_plugins for ext in plugin.file_extensions)
+
+
+@lru_cache(maxsize=1)
+def _load_schema() -> dict:
+    """Read the output schema from disk, once per process"""
+    # json is only needed here, and only when the schema is first requested
+    import json
+    with open(pathlib.Path(__file__).parent / 'schemas' / 'electron_microscopy.json') as f:
+        return json.load(f)
+
+
+# Locations of the DigitalMicrograph tags within the original metadata. Image stacks keep
+# the tags of interest under "plane info" rather than directly in ImageTags
+_DM3_IMAGE_TAGS = ('ImageList', 'TagGroup0', 'ImageTags')
+_DM3_STACK_INFO = _DM3_IMAGE_TAGS + ('plane info',)
+_DM3_STACK_TAGS = _DM3_STACK_INFO + ('TagGroup0', 'source tags')
+_DM3_TECNAI_INFO = _DM3_IMAGE_TAGS + ('Tecnai', 'Microscope Info')
+
+
+# values in the DigitalMicrograph "Microscope Info" tag group
+_DM3_MICROSCOPE_SPECS = (
+    _MappingSpec(('Indicated Magnification',), ('General_EM', 'magnification_indicated'),
+                 float, 'UNITLESS'),
+    _MappingSpec(('Actual Magnification',), ('General_EM', 'magnification_actual'),
+                 float, 'UNITLESS'),
+    _MappingSpec(('Cs(mm)',), ('TEM', 'spherical_aberration_coefficient'), float, 'MilliM'),
+    _MappingSpec(('STEM Camera Length',), ('TEM', 'camera_length'), float, 'MilliM'),
+    _MappingSpec(('Operation Mode',), ('TEM', 'operation_mode'), str),
+    _MappingSpec(('Imaging Mode',), ('TEM', 'imaging_mode'), str),
+    _MappingSpec(('Illumination Mode',), ('TEM', 'illumination_mode'), str),
+    _MappingSpec(('Microscope',), ('General_EM', 'microscope_name'), str),
+    _MappingSpec(('Stage Position', 'Stage X'), ('General_EM', 'stage_position', 'x'),
+                 float, 'MilliM', _div_1000),
+    _MappingSpec(('Stage Position', 'Stage Y'), ('General_EM', 'stage_position', 'y'),
+                 float, 'MilliM', _div_1000),
+    _MappingSpec(('Stage Position', 'Stage Z'), ('General_EM', 'stage_position', 'z'),
+                 float, 'MilliM', _div_1000),
+    _MappingSpec(('Stage Position', 'Stage Alpha'),
+                 ('General_EM', 'stage_position', 'tilt_alpha'), float, 'DEG'),
+    _MappingSpec(('Stage Position', 'Stage Beta'),
+                 ('General_EM', 'stage_position', 'tilt_beta'), float, 'DEG'),
+    _MappingSpec(('Emission Current (µA)',), ('General_EM', 'emission_current'), float, 'MicroA'),
+)
+
+# values in the DigitalMicrograph "Session Info" tag group
+_DM3_SESSION_SPECS = (
+    _MappingSpec(('Detector',), ('General_EM', 'detector_name'), str),
+    _MappingSpec(('Microscope',), ('General_EM', 'microscope_name'), str),
+)
+
+# values in the DigitalMicrograph "Meta Data" tag group
+_DM3_META_DATA_SPECS = (
+    _MappingSpec(('Acquisition Mode',), ('TEM', 'acquisition_mode'), str),
+    _MappingSpec(('Format',), ('TEM', 'acquisition_format'), str),
+    _MappingSpec(('Signal',), ('TEM', 'acquisition_signal'), str),
+    # sometimes the EDS signal label is in a different place
+    _MappingSpec(('Experiment keywords', 'TagGroup1', 'Label'), ('TEM', 'acquisition_signal'),
+                 str),
+)
+
+# a few miscellaneous DigitalMicrograph tags
+_DM3_MISC_SPECS = (
+    _MappingSpec(('Acquisition', 'Device', 'Name'), ('TEM', 'acquisition_device'), str),
+    _MappingSpec(('DataBar', 'Device Name'), ('TEM', 'acquisition_device'), str),
+    _MappingSpec(('Acquisition', 'Parameters', 'High Level', 'Exposure (s)'),
+                 ('General_EM', 'exposure_time'), float, 'SEC'),
+    _MappingSpec(('DataBar', 'Exposure Time (s)'), ('General_EM', 'exposure_time'), float, 'SEC'),
+    _MappingSpec(('GMS Version', 'Created'), ('General_EM', 'acquisition_software_version'),
+                 str),
+)
+
+# basic EELS metadata in the DigitalMicrograph "EELS" tag group
+_DM3_EELS_SPECS = (
+    _MappingSpec(('Acquisition', 'Exposure (s)'), ('General_EM', 'exposure_time'), float, 'SEC'),
+    _MappingSpec(('Acquisition', 'Integration time (s)'), ('EELS', 'integration_time'),
+                 float, 'SEC'),
+    _MappingSpec(('Acquisition', 'Number of frames'), ('EELS', 'number_of_samples'), int, 'NUM'),
+    _MappingSpec(('Experimental Conditions', 'Collection semi-angle (mrad)'),
+                 ('EELS', 'collection_angle'), float, 'MilliRAD'),
+    _MappingSpec(('Experimental Conditions', 'Convergence semi-angle (mrad)'),
+                 ('General_EM', 'convergence_angle'), float, 'MilliRAD'),
+)
+
+# EELS spectrometer metadata, from wherever DigitalMicrograph put it
+_DM3_SPECTROMETER_SPECS = (
+    _MappingSpec(('Aperture label',), ('EELS', 'aperture_size'),
+                 _strip_mm, 'MilliM'),
+    _MappingSpec(('Dispersion (eV/ch)',), ('EELS', 'dispersion_per_channel'), float, 'EV'),
+    _MappingSpec(('Energy loss (eV)',), ('EELS', 'energy_loss_offset'), float, 'EV'),
+    _MappingSpec(('Instrument name',), ('EELS', 'spectrometer_name'), str),
+    _MappingSpec(('Drift tube voltage (V)',), ('EELS', 'drift_tube_voltage'), float, 'V'),
+    _MappingSpec(('Drift tube enabled',), ('EELS', 'drift_tube_enabled'), bool),
+    _MappingSpec(('Prism offset (V)',), ('EELS', 'prism_shift_voltage'), float, 'V'),
+    # note space at end of "Prism offset enabled " because that's how
+    # it gets loaded in from DigitalMicrograph...
+    _MappingSpec(('Prism offset enabled ',), ('EELS', 'prism_shift_enabled'), bool),
+    _MappingSpec(('Slit width (eV)',), ('EELS', 'filter_slit_width'), float, 'EV'),
+    _MappingSpec(('Slit inserted',), ('EELS', 'filter_slit_inserted'), bool),
+)
+
+# values in the DigitalMicrograph "EDS" tag group
+_DM3_EDS_SPECS = (
+    _MappingSpec(('Detector Info', 'Azimuthal angle'), ('EDS', 'azimuth_angle'), float, 'DEG'),
+    _MappingSpec(('Detector Info', 'Detector type'), ('EDS', 'detector_type'), str),
+    _MappingSpec(('Acquisition', 'Dispersion (eV)'), ('EDS', 'dispersion_per_channel'),
+                 float, 'EV'),
+    _MappingSpec(('Detector Info', 'Elevation angle'), ('EDS', 'elevation_angle'), float, 'DEG'),
+    _MappingSpec(('Detector Info', 'Incidence angle'), ('EDS', 'incidence_angle'), float, 'DEG'),
+    _MappingSpec(('Live time',), ('EDS', 'live_time'), float, 'SEC'),
+    _MappingSpec(('Real time',), ('EDS', 'real_time'), float, 'SEC'),
+    _MappingSpec(('Detector Info', 'Solid angle'), ('EDS', 'solid_angle'), float, 'SR'),
+    _MappingSpec(('Detector Info', 'Stage tilt'), ('EDS', 'stage_tilt'), float, 'DEG'),
+)
+
+# values in the "ObjectInfo" node of TIA (.ser/.emi) files
+_TIA_SPECS = (
+    _MappingSpec(('ExperimentalConditions', 'MicroscopeConditions', 'AcceleratingVoltage'),
+                 ('General_EM', 'accelerating_voltage'), float, 'V'),
+    _MappingSpec(('AcquireInfo', 'DwellTimePath'), ('General_EM', 'dwell_time'), float, 'SEC'),
+    _MappingSpec(('AcquireInfo', 'FrameTime'), ('General_EM', 'frame_time'), float, 'SEC'),
+    _MappingSpec(('ExperimentalDescription', 'Microscope'), ('General_EM', 'microscope_name'),
+                 str),
+    _MappingSpec(('ExperimentalDescription', 'High tension_kV'),
+                 ('General_EM', 'accelerating_voltage'), float, 'KiloV'),
+    _MappingSpec(('ExperimentalDescription', 'Emission_uA'), ('General_EM', 'emission_current'),
+                 float, 'MicroA'),
+    # this value is often more specific than the one from HyperSpy,
+    # so override acquisition mode:
+    _MappingSpec(('ExperimentalDescription', 'Mode'), ('General_EM', 'acquisition_mode'),
+                 str, None, str.strip, override=True),
+    _MappingSpec(('ExperimentalDescription', 'Defocus_um'), ('TEM', 'defocus'), float, 'MicroM'),
+    _MappingSpec(('ExperimentalDescription', 'Magnification_x'),
+                 ('General_EM', 'magnification_indicated'), float, 'UNITLESS'),
+    _MappingSpec(('ExperimentalDescription', 'Camera length_m'), ('TEM', 'camera_length'),
+                 float, 'M'),
+    _MappingSpec(('ExperimentalDescription', 'Spot size'), ('TEM', 'spot_size'), int, 'UNITLESS'),
+    _MappingSpec(('ExperimentalDescription', 'Stage X_um'), ('General_EM', 'stage_position', 'x'),
+                 float, 'MicroM'),
+    _MappingSpec(('ExperimentalDescription', 'Stage Y_um'), ('General_EM', 'stage_position', 'y'),
+                 float, 'MicroM'),
+    _MappingSpec(('ExperimentalDescription', 'Stage Z_um'), ('General_EM', 'stage_position', 'z'),
+                 float, 'MicroM'),
+    _MappingSpec(('ExperimentalDescription', 'Stage A_deg'),
+                 ('General_EM', 'stage_position', 'tilt_alpha'), float, 'DEG'),
+    _MappingSpec(('ExperimentalDescription', 'Stage B_deg'),
+                 ('General_EM', 'stage_position', 'tilt_beta'), float, 'DEG'),
+    _MappingSpec(('ExperimentalDescription', 'Filter mode'), ('EELS', 'spectrometer_mode'), str),
+    _MappingSpec(('ExperimentalDescription', 'Filter selected dispersion_eV/Channel'),
+                 ('EELS', 'dispersion_per_channel'), float, 'EV'),
+    _MappingSpec(('ExperimentalDescription', 'Filter selected aperture'),
+                 ('EELS', 'aperture_size'), _strip_mm, 'MilliM'),
+    _MappingSpec(('ExperimentalDescription', 'Filter prism shift_eV'),
+                 ('EELS', 'prism_shift_energy'), float, 'EV'),
+    _MappingSpec(('ExperimentalDescription', 'Filter drift tube_eV'),
+                 ('EELS', 'drift_tube_energy'), float, 'EV'),
+    _MappingSpec(('ExperimentalDescription', 'Filter total energy loss_eV'),
+                 ('EELS', 'total_energy_loss'), float, 'EV'),
+)
+
+# values in the "fei_metadata" node of FEI/ThermoFisher tiffs
+_TIFF_SPECS = (
+    _MappingSpec(('System', 'Software'), ('General_EM', 'acquisition_software_version'), str),
+    _MappingSpec(('Beam', 'Spot'), ('SEM', 'spot_size'), int),
+    _MappingSpec(('Beam', 'HV'), ('General_EM', 'accelerating_voltage'), float, 'KiloV', _div_1000),
+    _MappingSpec(('EBeam', 'HV'), ('General_EM', 'accelerating_voltage'),
+                 float, 'KiloV', _div_1000),
+    _MappingSpec(('EBeam', 'HFW'), ('SEM', 'horizontal_field_width'), float, 'M'),
+    _MappingSpec(('EBeam', 'VFW'), ('SEM', 'vertical_field_width'), float, 'M'),
+    _MappingSpec(('EBeam', 'WD'), ('SEM', 'working_distance'), float, 'M'),
+    _MappingSpec(('EBeam', 'BeamCurrent'), ('General_EM', 'beam_current'), float, 'A'),
+    _MappingSpec(('Stage', 'StageX'), ('General_EM', 'stage_position', 'x'),
+                 float, 'MilliM', _times_1000, override=True),
+    _MappingSpec(('Stage', 'StageY'), ('General_EM', 'stage_position', 'y'),
+                 float, 'MilliM', _times_1000, override=True),
+    _MappingSpec(('Stage', 'StageZ'), ('General_EM', 'stage_position', 'z'),
+                 float, 'MilliM', _times_1000, override=True),
+    _MappingSpec(('Stage', 'StageR'), ('General_EM', 'stage_position', 'rotation'),
+                 float, 'DEG', override=True),
+    _MappingSpec(('Stage', 'StageT'), ('General_EM', 'stage_position', 'tilt_alpha'),
+                 float, 'DEG', override=True),
+    _MappingSpec(('Stage', 'StageTb'), ('General_EM', 'stage_position', 'tilt_beta'),
+                 float, 'DEG', override=True),
+    _MappingSpec(('Scan', 'PixelWidth'), ('SEM', 'pixel_width'), float, 'M'),
+    _MappingSpec(('Scan', 'PixelHeight'), ('SEM', 'pixel_height'), float, 'M'),
+    _MappingSpec(('Scan', 'HorFieldsize'), ('SEM', 'horizontal_field_width'), float, 'M'),
+    _MappingSpec(('Scan', 'VerFieldsize'), ('SEM', 'vertical_field_width'), float, 'M'),
+    _MappingSpec(('Scan', 'FrameTime'), ('General_EM', 'frame_time'), _nonzero_float,
+                 'SEC'),
+    _MappingSpec(('Image', 'MagnificationMode'), ('SEM', 'magnification_mode')),
+    # confirmed in Quanta SEM manual that the pressure units are Pascals
+    _MappingSpec(('Vacuum', 'ChPressure'), ('SEM', 'chamber_pressure'),
+                 _nonzero_float, 'PA'),
+)
+
+
+@lru_cache(maxsize=16)
+def _load_signals(file_path: str, mtime_ns: int, size: int) -> Tuple:
+    """Lazily load the signals in a file with HyperSpy, reusing recent results
+
+    The modification time and size are part of the cache key so a file that changes on
+    disk is read again. Only metadata is ever used, so the files backing lazy signals are
+    closed before the signals are cached.
+
+    Args:
+        file_path: Absolute path to the file
+        mtime_ns: Modification time of the file, in nanoseconds
+        size: Size of the file in bytes
+    Returns:
+        Tuple of the signals found in the file
+    """
+    signals = hs_load(file_path, lazy=True)
+    if not isinstance(signals, list):
+        signals = [signals]
+    # lazy signals backed by (e.g.) HDF5 files keep the file open until told otherwise
+    for signal in signals:
+        if hasattr(signal, 'close_file'):
+            signal.close_file()
+    return tuple(signals)
+
+
+@lru_cache(maxsize=4096)
+def _dtb_slug(key: str) -> str:
+    """Name under which a ``DictionaryTreeBrowser`` stores a key (e.g., "Microscope_Info")"""
+    return slugify(key, valid_variable_name=True)
+
+
+class DTBView(Mapping):
+    """Read-only :class:`~collections.abc.Mapping` over a HyperSpy ``DictionaryTreeBrowser``
+
+    ``DictionaryTreeBrowser.as_dictionary()`` deep-copies the whole metadata tree, which can be
+    tens of thousands of nodes for DigitalMicrograph or Bruker files. This view resolves keys
+    directly against the tree instead, wrapping any sub-tree it returns in another view, so only
+    the values that are actually looked up are ever touched.
+
+    Keys may be given as in the original metadata (e.g., "Microscope Info"), but iterating over
+    the view yields the slugified names the tree stores them under (e.g., "Microscope_Info"), and
+    sub-trees are returned as views. Callers that need a plain copy with the original keys should
+    call ``as_dictionary()`` on the underlying tree.
+    """
+
+    def __init__(self, dtb: DictionaryTreeBrowser):
+        self._dtb = dtb
+        # the names of the items in the tree, in order, which excludes the attributes and methods
+        # of the tree itself (e.g., "keys" or "copy")
+        self._keys = dict.fromkeys(dtb.keys())
+        # views of sub-trees, so repeated walks through the same node reuse them
+        self._children = {}
+
+    def __getitem__(self, key: str) -> Any:
+        child = self._children.get(key)
+        if child is not None:
+            return child
+        if not isinstance(key, str) or _dtb_slug(key) not in self._keys:
+            raise KeyError(key)
+        value = self._dtb[key]
+        if isinstance(value, DictionaryTreeBrowser):
+            value = self._children[key] = DTBView(value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
 class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
     """Extract metadata specific to electron microscopy.
 
@@ -30,39 +482,72 @@ class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
 
     The allowed metadata values are controlled by the JSONSchema specification in the
     ``schemas/electron_microscopy.json`` file.
+
+    The context dictionary for the electron microscopy parser includes one field:
+        - ``include_raw_metadata``: Whether to copy the original metadata into the summary
+          for this call, overriding the setting given to the constructor
     """
 
+    def __init__(self, include_raw_metadata: bool = False):
+        """
+        Args:
+            include_raw_metadata: Whether to copy the complete original metadata of each file
+                into the ``raw_metadata`` field of the summary. This tree can be very large, so
+                it is left out unless requested
+        """
+        super().__init__()
+        self.include_raw_metadata = include_raw_metadata
+
     def _extract_file(self, file_path: str, context: Dict = None) -> Dict:
+        # reject files no HyperSpy reader would accept before paying for ``hs_load``
+        if pathlib.Path(file_path).suffix.lstrip('.').lower() not in _HS_EXTENSIONS:
+            raise ValueError(f'HyperSpy cannot read files of this type: {file_path}')
+
         self.em = {}
         self.inst_data = None
 
-        # Read file lazily (reduce memory), both HyperSpy-formatted and raw data
-        self.hs_data = hs_load(file_path, lazy=True)
-
-        # if hs_data is a list, pull out first for metadata extraction
-        if isinstance(self.hs_data, list):
-            self.hs_data = self.hs_data[0]
-
-        self.meta = self.hs_data.metadata.as_dictionary()
-        self.raw_meta = self.hs_data.original_metadata.as_dictionary()
-        self.em['raw_metadata'] = self.raw_meta
-
-        for s in ['General', 'General_EM', 'TEM', 'SEM', 'EDS', 'EELS']:
-            self.em[s] = {}
-
-        # call each individual processor
-        self._process_hs_data()
-        self._dm3_general_info()
-        self._dm3_eels_info()
-        self._dm3_tecnai_info()
-        self._dm3_eds_info()
-        self._tia_info()
-        self._tiff_info()
-
-        # Remove None/empty values
-        for key, val in list(self.em.items()):
-            if val is None or val == [] or val == {}:
-                self.em.pop(key)
+        # Read file lazily (reduce memory), both HyperSpy-formatted and raw data. Only the
+        # metadata is used, so the signal data itself is never read from disk
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        signals = _load_signals(file_path, stat.st_mtime_ns, stat.st_size)
+
+        # if the file contains several signals, use the one with the most metadata
+        self.hs_data = max(signals, key=lambda x: len(x.original_metadata.keys()))
+
+        # look values up through views rather than deep copies of the (potentially huge) trees
+        self.meta = DTBView(self.hs_data.metadata)
+        self.raw_meta = DTBView(self.hs_data.original_metadata)
+        if context is None:
+            context = dict()
+        if context.get('include_raw_metadata', self.include_raw_metadata):
+            # the record itself must be plain JSON, so only the exported copy is materialized
+            raw_metadata = self.hs_data.original_metadata.as_dictionary()
+            if raw_metadata:
+                self.em['raw_metadata'] = raw_metadata
+
+        # each file comes from a single format, so only run the processors whose
+        # vendor-specific metadata is actually present
+        processors = []
+        if get_val(self.raw_meta, _DM3_IMAGE_TAGS) is not None:
+            # the DigitalMicrograph tags live at the same place for every processor,
+            # so find them once
+            self._dm3_pre_path = self.__get_dm3_tag_pre_path()
+            self._dm3_tags = get_val(self.raw_meta, self._dm3_pre_path) or {}
+            processors += [self._dm3_general_info, self._dm3_eels_info,
+                           self._dm3_tecnai_info, self._dm3_eds_info]
+        if 'ObjectInfo' in self.raw_meta:
+            processors.append(self._tia_info)
+        if 'fei_metadata' in self.raw_meta:
+            processors.append(self._tiff_info)
+
+        # collect the mappings from each individual processor, in order of precedence, and
+        # apply them all in a single pass
+        mapping = self._process_hs_data()
+        for processor in processors:
+            mapping += processor()
+        # sections are created as values are written to them, so none of them are empty
+        map_dict_values(mapping)
 
         record = {}
         if self.em:
@@ -70,98 +555,39 @@ class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
 
         return record
 
-    def _process_hs_data(self) -> None:
-        """Parse metadata that was already extracted from HyperSpy"""
+    def _process_hs_data(self) -> List[MappingElements]:
+        """Parse metadata that was already extracted from HyperSpy
+
+        Returns:
+            The mappings from the HyperSpy metadata into the summary
+        """
         # Image mode is SEM, TEM, or STEM
         # STEM is a subset of TEM
-        if "SEM" in self.meta.get('Acquisition_instrument', {}).keys():
+        acq_inst = self.meta.get('Acquisition_instrument') or {}
+        if "SEM" in acq_inst:
             self.inst = "SEM"
-        elif "TEM" in self.meta.get('Acquisition_instrument', {}).keys():
+        elif "TEM" in acq_inst:
             self.inst = "TEM"
         else:
             self.inst = 'None'
 
         # HS data
-        self.inst_data = get_val(self.meta, ('Acquisition_instrument', self.inst))
+        mapping = []
+        self.inst_data = acq_inst.get(self.inst) or None
         if self.inst_data is not None:
             source = self.inst_data
+            stage = self.inst_data.get('Stage') or {}
             dest = self.em
 
-            mapping = [
-                MappingElements(
-                    source_dict=source, source_path='acquisition_mode',
-                    dest_dict=dest, dest_path=('General_EM', 'acquisition_mode'),
-                    cast_fn=str, units=None, conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, source_path='beam_current',
-                    dest_dict=dest, dest_path=('General_EM', 'beam_current'),
-                    cast_fn=float, units='NanoA', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, source_path='beam_energy',
-                    dest_dict=dest, dest_path=('General_EM', 'beam_energy'),
-                    cast_fn=float, units='KiloEV', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path='convergence_angle',
-                    dest_dict=dest, dest_path=('General_EM', 'convergence_angle'),
-                    cast_fn=float, units='MilliRAD', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path='microscope',
-                    dest_dict=dest, dest_path=('General_EM', 'microscope_name'),
-                    cast_fn=str, units=None, conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, source_path='probe_area',
-                    dest_dict=dest, dest_path=('General_EM', 'probe_area'),
-                    cast_fn=float, units='NanoM2', conv_fn=None,
-                    override=False),
-
-                # stage positions
-                MappingElements(
-                    source_dict=source, source_path=('Stage', 'rotation'), dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'rotation'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, source_path=('Stage', 'tilt_alpha'), dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, source_path=('Stage', 'tilt_beta'), dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, dest_dict=dest, source_path=('Stage', 'x'),
-                    dest_path=('General_EM', 'stage_position', 'x'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path=('Stage', 'y'), dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'y'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path=('Stage', 'z'), dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'z'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-
-                # camera length/working distance
-                MappingElements(
-                    source_dict=source, source_path='camera_length',
-                    dest_dict=dest, dest_path=('TEM', 'camera_length'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path='working_distance',
-                    dest_dict=dest, dest_path=('SEM', 'working_distance'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False)]
+            mapping += _bind(_HS_INSTRUMENT_SPECS, source, dest) + \
+                _bind(_HS_STAGE_SPECS, stage, dest)
 
             # some logic to parse how Zeiss stores floats in their SEM tifs:
-            mag = get_val(source, path='magnification')
+            mag = source.get('magnification')
             if mag and isinstance(mag, str):
-                if ' K X' in mag:
-                    mag = mag.replace(' K X', '')
+                match = _ZEISS_K_X.search(mag)
+                if match is not None:
+                    mag = mag[:match.start()]
                     try:
                         mag = float(mag)
                         mag *= 1000
@@ -175,51 +601,11 @@ class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
                 cast_fn=float, units='UNITLESS', conv_fn=None,
                 override=False)]
 
-            map_dict_values(mapping)
-
-            self._process_hs_detectors()
-
-        source = self.meta
-        dest = self.em
-        mapping = [
-            # Elements present (if known)
-            MappingElements(
-                source_dict=source, dest_dict=dest, source_path=('Sample', 'elements'),
-                dest_path=('General_EM', 'elements'),
-                cast_fn=list, units=None, conv_fn=None, override=False),
-            # General metadata
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'date'), dest_path=('General', 'date'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'doi'), dest_path=('General', 'doi'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'original_filename'),
-                dest_path=('General', 'original_filename'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'notes'), dest_path=('General', 'notes'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'time'), dest_path=('General', 'time'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'time_zone'), dest_path=('General', 'time_zone'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'title'), dest_path=('General', 'title'),
-                cast_fn=str, units=None, conv_fn=None, override=False)]
+            mapping += self._process_hs_detectors()
 
-        map_dict_values(mapping)
+        mapping += _bind(_HS_GENERAL_SPECS, self.meta, self.em)
         self._process_hs_axes()
+        return mapping
 
     def _process_hs_axes(self) -> None:
         """Parses the HyperSpy signal axis calibrations into a format that can be stored with the
@@ -228,235 +614,72 @@ class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
         """
         axes = self.hs_data.axes_manager.as_dictionary()
 
-        for k, v in axes.items():
+        for v in axes.values():
             # remove some non-relevant values
-            for to_remove in ['_type', 'navigate', 'is_binned']:
-                if to_remove in v:
-                    del axes[k][to_remove]
+            for to_remove in ('_type', 'navigate', 'is_binned'):
+                v.pop(to_remove, None)
 
             # remove potentially unserializable values from axes:
-            for key in v:
-                if v[key] is Undefined:
+            for key, value in v.items():
+                if value is Undefined:
                     v[key] = None
 
             # attempt to standardize units according to QUDT:
             if 'units' in v:
-                axes[k]['units'] = standardize_unit(axes[k]['units'])
+                v['units'] = standardize_unit(v['units'])
 
-        self.em['General']['axis_calibration'] = axes
-        self.em['General']['data_dimensions'] = [v['size'] for v in
-                                                 self.hs_data.axes_manager.as_dictionary().values()]
+        general = self.em.setdefault('General', {})
+        general['axis_calibration'] = axes
+        general['data_dimensions'] = [v['size'] for v in axes.values()]
 
-    def _process_hs_detectors(self) -> None:
+    def _process_hs_detectors(self) -> List[MappingElements]:
         """Parses HyperSpy-formatted metadata specific to detectors as specified by
         http://hyperspy.org/hyperspy-doc/current/user_guide/metadata_structure.html
         """
-        detector_node = get_val(self.inst_data, 'Detector')
-        dest_dict = self.em
-        mapping = [
-            MappingElements(
-                source_dict=self.inst_data, source_path='detector_type',
-                dest_dict=dest_dict, dest_path=('General_EM', 'detector_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False
-            )
-        ]
+        detector_node = self.inst_data.get('Detector') or None
+        if detector_node is None and 'detector_type' not in self.inst_data:
+            # nothing to map, so don't bother building a mapping list
+            return []
 
+        mapping = _bind(_HS_DETECTOR_SPECS, self.inst_data, self.em)
         if detector_node is not None:
-            mapping += [
-                # EDS
-                MappingElements(
-                    source_dict=detector_node, source_path=('EDS', 'azimuth_angle'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'azimuth_angle'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EDS', 'elevation_angle'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'elevation_angle'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EDS', 'energy_resolution_MnKa'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'energy_resolution_MnKa'),
-                    cast_fn=float, units='EV', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EDS', 'live_time'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'live_time'),
-                    cast_fn=float, units='SEC', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EDS', 'real_time'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'real_time'),
-                    cast_fn=float, units='SEC', conv_fn=None, override=False),
+            eds = detector_node.get('EDS') or {}
+            eels = detector_node.get('EELS') or {}
+            mapping += _bind(_HS_EDS_SPECS, eds, self.em) + _bind(_HS_EELS_SPECS, eels, self.em)
+        return mapping
 
-                # EELS
-                MappingElements(
-                    source_dict=detector_node, source_path=('EELS', 'aperture_size'),
-                    dest_dict=dest_dict, dest_path=('EELS', 'aperture_size'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EELS', 'collection_angle'),
-                    dest_dict=dest_dict, dest_path=('EELS', 'collection_angle'),
-                    cast_fn=float, units='MilliRAD', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EELS', 'dwell_time'),
-                    dest_dict=dest_dict, dest_path=('General_EM', 'dwell_time'),
-                    cast_fn=float, units='SEC', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EELS', 'exposure'),
-                    dest_dict=dest_dict, dest_path=('General_EM', 'exposure_time'),
-                    cast_fn=float, units='SEC', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EELS', 'frame_number'),
-                    dest_dict=dest_dict, dest_path=('EELS', 'number_of_samples'),
-                    cast_fn=int, units='NUM', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EELS', 'spectrometer'),
-                    dest_dict=dest_dict, dest_path=('EELS', 'spectrometer_name'),
-                    cast_fn=str, units=None, conv_fn=None, override=False),
-            ]
-        map_dict_values(mapping)
-
-    def _dm3_general_info(self) -> None:
+    def _dm3_general_info(self) -> List[MappingElements]:
         """Parse commonly-found TEM-related tags in DigitalMicrograph files"""
+        # resolve each tag group once, rather than walking down from the root for every value
+        tags = self._dm3_tags
+        micro_info = tags.get('Microscope Info') or {}
+        session_info = tags.get('Session Info') or {}
+        meta_data = tags.get('Meta Data') or {}
+
         # process "Microscope Info"
-        base = self.__get_dm3_tag_pre_path() + ('Microscope Info',)
         dest_dict = self.em
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Indicated Magnification',),
-                dest_dict=dest_dict, dest_path=('General_EM', 'magnification_indicated'),
-                cast_fn=float, units='UNITLESS', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Actual Magnification',),
-                dest_dict=dest_dict, dest_path=('General_EM', 'magnification_actual'),
-                cast_fn=float, units='UNITLESS', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Cs(mm)',),
-                dest_dict=dest_dict, dest_path=('TEM', 'spherical_aberration_coefficient'),
-                cast_fn=float, units='MilliM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('STEM Camera Length',),
-                dest_dict=dest_dict, dest_path=('TEM', 'camera_length'),
-                cast_fn=float, units='MilliM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Operation Mode',),
-                dest_dict=dest_dict, dest_path=('TEM', 'operation_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Imaging Mode',),
-                dest_dict=dest_dict, dest_path=('TEM', 'imaging_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Illumination Mode',),
-                dest_dict=dest_dict, dest_path=('TEM', 'illumination_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Microscope',),
-                dest_dict=dest_dict, dest_path=('General_EM', 'microscope_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Stage Position', 'Stage X'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'stage_position', 'x'),
-                cast_fn=float, units='MilliM', conv_fn=lambda x: x/1000, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Stage Position', 'Stage Y'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'stage_position', 'y'),
-                cast_fn=float, units='MilliM', conv_fn=lambda x: x / 1000, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Stage Position', 'Stage Z'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'stage_position', 'z'),
-                cast_fn=float, units='MilliM', conv_fn=lambda x: x / 1000, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Stage Position', 'Stage Alpha'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                cast_fn=float, units='DEG', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Stage Position', 'Stage Beta'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                cast_fn=float, units='DEG', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Emission Current (µA)',),
-                dest_dict=dest_dict, dest_path=('General_EM', 'emission_current'),
-                cast_fn=float, units='MicroA', conv_fn=None, override=False),
-        ]
-
-        voltage = get_val(self.raw_meta, base + ('Voltage',), float)
+        mapping = _bind(_DM3_MICROSCOPE_SPECS, micro_info, dest_dict)
+
+        voltage = get_val(micro_info, 'Voltage', float)
         if voltage is not None:
             mapping += [
                 MappingElements(
-                    source_dict=self.raw_meta, dest_dict=dest_dict,
-                    source_path=base + ('Voltage',), cast_fn=float,
+                    source_dict=micro_info, dest_dict=dest_dict,
+                    source_path=('Voltage',), cast_fn=float,
                     dest_path=('General_EM', 'accelerating_voltage'),
                     units='KiloV' if voltage >= 1000 else 'V',
-                    conv_fn=lambda x: x / 1000 if voltage >= 1000 else x, override=False)
+                    conv_fn=_div_1000 if voltage >= 1000 else None, override=False)
             ]
 
-        # "Session Info"
-        base = self.__get_dm3_tag_pre_path() + ('Session Info',)
-        mapping += [
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Detector',),
-                dest_dict=dest_dict, dest_path=('General_EM', 'detector_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Microscope',),
-                dest_dict=dest_dict, dest_path=('General_EM', 'microscope_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False)]
-
-        # "Meta Data"
-        base = self.__get_dm3_tag_pre_path() + ('Meta Data',)
-        mapping += [
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Acquisition Mode',),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Format',),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_format'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Signal',),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_signal'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            # sometimes the EDS signal label is in a different place
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Experiment keywords', 'TagGroup1', 'Label'),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_signal'),
-                cast_fn=str, units=None, conv_fn=None, override=False)
-        ]
-
-        # a few miscellaneous DM tags:
-        base = self.__get_dm3_tag_pre_path()
-        mapping += [
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Acquisition', 'Device', 'Name'),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_device'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('DataBar', 'Device Name'),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_device'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Acquisition', 'Parameters', 'High Level', 'Exposure (s)'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'exposure_time'),
-                cast_fn=float, units='SEC', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('DataBar', 'Exposure Time (s)'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'exposure_time'),
-                cast_fn=float, units='SEC', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('GMS Version', 'Created'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'acquisition_software_version'),
-                cast_fn=str, units=None, conv_fn=None, override=False)
-        ]
-
-        if get_val(self.raw_meta, ('ImageList', 'TagGroup0', 'ImageTags')) is not None:
-            # we have DigitalMicrograph tags, so set acquisition software name
-            set_val_units(nest_dict=dest_dict, path=('General_EM', 'acquisition_software_name'),
-                          value='DigitalMicrograph')
+        mapping += _bind(_DM3_SESSION_SPECS, session_info, dest_dict) + \
+            _bind(_DM3_META_DATA_SPECS, meta_data, dest_dict) + \
+            _bind(_DM3_MISC_SPECS, tags, dest_dict)
 
-        map_dict_values(mapping)
+        # only called when we have DigitalMicrograph tags, so set acquisition software name
+        set_val_units(nest_dict=dest_dict, path=('General_EM', 'acquisition_software_name'),
+                      value='DigitalMicrograph')
+
+        return mapping
 
     def __get_dm3_tag_pre_path(self) -> Tuple:
         """Get the path into a dictionary where the important DigitalMicrograph metadata is
@@ -470,168 +693,33 @@ class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
             in the ``raw_metadata`` where the important metadata is stored
         """
         # test if we have a stack
-        stack_path = ('ImageList', 'TagGroup0', 'ImageTags', 'plane info')
-        stack_val = get_val(self.raw_meta, stack_path)
+        stack_val = get_val(self.raw_meta, _DM3_STACK_INFO)
         if stack_val is not None:
             # we're in a stack
-            pre_path = ('ImageList', 'TagGroup0', 'ImageTags', 'plane info', 'TagGroup0',
-                        'source tags')
-        else:
-            pre_path = ('ImageList', 'TagGroup0', 'ImageTags')
+            return _DM3_STACK_TAGS
+        return _DM3_IMAGE_TAGS
 
-        return pre_path
-
-    def _dm3_eels_info(self) -> None:
+    def _dm3_eels_info(self) -> List[MappingElements]:
         """Parse EELS-related information from Gatan DigitalMicrograph format
         """
         # basic EELS metadata
-        pre_path = self.__get_dm3_tag_pre_path()
-        base = pre_path + ('EELS', )
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Acquisition', 'Exposure (s)'),
-                dest_path=('General_EM', 'exposure_time'), units='SEC',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Acquisition', 'Integration time (s)'),
-                dest_path=('EELS', 'integration_time'), units='SEC',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Acquisition', 'Number of frames'),
-                dest_path=('EELS', 'number_of_samples'), units='NUM',
-                conv_fn=None, cast_fn=int, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Experimental Conditions', 'Collection semi-angle (mrad)'),
-                dest_path=('EELS', 'collection_angle'), units='MilliRAD',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Experimental Conditions', 'Convergence semi-angle (mrad)'),
-                dest_path=('General_EM', 'convergence_angle'), units='MilliRAD',
-                conv_fn=None, cast_fn=float, override=False)]
+        tags = self._dm3_tags
+        eels = tags.get('EELS') or {}
 
         # spectrometer metadata
         # is usually at one of two places, so try both
-        spect_dict = get_val(self.raw_meta, pre_path + ('EELS', 'Acquisition', 'Spectrometer'))
-        if spect_dict is not None:
-            spect_path = pre_path + ('EELS', 'Acquisition', 'Spectrometer')
-        else:
-            spect_path = pre_path + ('EELS Spectrometer',)
-        mapping += [
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Aperture label',),
-                dest_path=('EELS', 'aperture_size'), units='MilliM', conv_fn=None,
-                cast_fn=lambda s: float(s.replace('mm', '')), override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Dispersion (eV/ch)',),
-                dest_path=('EELS', 'dispersion_per_channel'), units='EV', conv_fn=None,
-                cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Energy loss (eV)',),
-                dest_path=('EELS', 'energy_loss_offset'), units='EV', conv_fn=None,
-                cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Instrument name',),
-                dest_path=('EELS', 'spectrometer_name'), units=None, conv_fn=None, cast_fn=str,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Drift tube voltage (V)',),
-                dest_path=('EELS', 'drift_tube_voltage'), units='V', conv_fn=None, cast_fn=float,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Drift tube enabled',),
-                dest_path=('EELS', 'drift_tube_enabled'), units=None, conv_fn=None, cast_fn=bool,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Prism offset (V)',),
-                dest_path=('EELS', 'prism_shift_voltage'), units='V', conv_fn=None,
-                cast_fn=float, override=False),
-            # note space at end of "Prism offset enabled " because that's how
-            # it gets loaded in from DigitalMicrograph...
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Prism offset enabled ',),
-                dest_path=('EELS', 'prism_shift_enabled'), units=None, conv_fn=None,
-                cast_fn=bool, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Slit width (eV)',),
-                dest_path=('EELS', 'filter_slit_width'), units='EV', conv_fn=None, cast_fn=float,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Slit inserted',),
-                dest_path=('EELS', 'filter_slit_inserted'), units=None, conv_fn=None,
-                cast_fn=bool, override=False),
-        ]
-        map_dict_values(mapping)
+        spect = (eels.get('Acquisition') or {}).get('Spectrometer') or \
+            tags.get('EELS Spectrometer') or {}
+        return _bind(_DM3_EELS_SPECS, eels, self.em) + \
+            _bind(_DM3_SPECTROMETER_SPECS, spect, self.em)
 
-    def _dm3_eds_info(self) -> None:
+    def _dm3_eds_info(self) -> List[MappingElements]:
         """Parse EDS-related information from Gatan DigitalMicrograph format"""
-        pre_path = self.__get_dm3_tag_pre_path()
-        base = pre_path + ('EDS',)
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Azimuthal angle'),
-                dest_path=('EDS', 'azimuth_angle'), units='DEG', conv_fn=None, cast_fn=float,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Detector type'),
-                dest_path=('EDS', 'detector_type'), units=None, conv_fn=None, cast_fn=str,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Acquisition', 'Dispersion (eV)'),
-                dest_path=('EDS', 'dispersion_per_channel'), units='EV', conv_fn=None,
-                cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Elevation angle'),
-                dest_path=('EDS', 'elevation_angle'), units='DEG', conv_fn=None, cast_fn=float,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Incidence angle'),
-                dest_path=('EDS', 'incidence_angle'), units='DEG', conv_fn=None, cast_fn=float,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Live time',),
-                dest_path=('EDS', 'live_time'), units='SEC', conv_fn=None, cast_fn=float,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Real time',),
-                dest_path=('EDS', 'real_time'), units='SEC', conv_fn=None, cast_fn=float,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Solid angle'),
-                dest_path=('EDS', 'solid_angle'), units='SR', conv_fn=None, cast_fn=float,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Stage tilt'),
-                dest_path=('EDS', 'stage_tilt'), units='DEG', conv_fn=None, cast_fn=float,
-                override=False)
-        ]
-
-        map_dict_values(mapping)
+        tags = self._dm3_tags
+        eds = tags.get('EDS') or {}
+        return _bind(_DM3_EDS_SPECS, eds, self.em)
 
-    def _dm3_tecnai_info(self, delimiter: Optional[str] = u'\u2028') -> None:
+    def _dm3_tecnai_info(self, delimiter: Optional[str] = u'\u2028') -> List[MappingElements]:
         """Some FEI Microscopes will write additional metadata into dm3 files in a long string
         separated by a unicode delimiter (u'\u2028'), present at
         ``ImageList.TagGroup0.ImageTags.Tecnai.Microscope_Info``. This method parses that
@@ -642,190 +730,61 @@ class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
                 Should not need to be provided (this value is hard-coded in DigitalMicrograph), but
                 specified as a parameter for future flexibility
         """
-        def __find_val(s_to_find, list_to_search):
-            """Return the first value in ``list_to_search`` that contains ``s_to_find``,
-            or ``None`` if it is not found
-
-            Note: If needed, this could be improved to use regex instead, which would provide
-            more control over the patterns to return
+        def __extract_val(regex: Pattern, str_to_search: Optional[str],
+                          match_num: int = 1) -> Optional[str]:
+            """Extract a value from a string based on a grouped (and compiled) regex
             """
-            res = [x for x in list_to_search if s_to_find in x]
-            if len(res) > 0:
-                res = res[0]
-                # remove the string we searched for from the beginning of
-                # the res
-                return re.sub("^" + s_to_find, "", res)
-            else:
+            if str_to_search is None:
                 return None
-
-        def __extract_val(regex: str, str_to_search: str, match_num: int = 1) -> Optional[str]:
-            """Extract a value from a string based on a grouped regex
-            """
-            result = re.compile(regex).search(str_to_search)
+            result = regex.search(str_to_search)
             if result is not None:
                 result = result[match_num]
             return result
 
-        path_to_tecnai = ('ImageList', 'TagGroup0', 'ImageTags', 'Tecnai', 'Microscope Info')
-        self.tecnai_info = get_val(self.raw_meta, path_to_tecnai)
+        self.tecnai_info = get_val(self.raw_meta, _DM3_TECNAI_INFO)
 
         if self.tecnai_info is None:
             # if tecnai info is not present, return early to save some work
-            return
+            return []
         else:
-            # split the tecnai_info string into a list
+            # split the tecnai_info string into a list, and find the lines we need in one pass
             self.tecnai_info = self.tecnai_info.split(delimiter)
-
-            # we override existing values since Tecnai info is more specific
-            mapping = [
-                MappingElements(
-                    source_dict={
-                        'Microscope_Name': __find_val('Microscope ', self.tecnai_info)},
-                    source_path='Microscope_Name', dest_dict=self.em,
-                    dest_path=('General_EM', 'microscope_name'), cast_fn=str,
-                    units=None, conv_fn=None, override=True),
-                MappingElements(
-                    source_dict={
-                        'Extractor_Voltage':
-                            __extract_val(r'Extr volt (\d*) V', __find_val('Extr volt ',
-                                                                           self.tecnai_info))},
-                    source_path='Extractor_Voltage', dest_dict=self.em,
-                    dest_path=('TEM', 'extractor_voltage'), cast_fn=int,
-                    units='V', conv_fn=None, override=True),
-                MappingElements(
-                    source_dict={
-                        'Emission_Current':
-                            __extract_val(r'Emission ([\d|\.]*)uA', __find_val('Emission ',
-                                                                               self.tecnai_info))},
-                    source_path='Emission_Current', dest_dict=self.em,
-                    dest_path=('General_EM', 'emission_current'), cast_fn=float,
-                    units='MicroA', conv_fn=None, override=True),
-                MappingElements(
-                    source_dict={
-                        'Operation_Mode':
-                            __extract_val(r'(.*) Defocus', __find_val('Mode ', self.tecnai_info))},
-                    source_path='Operation_Mode', dest_dict=self.em,
-                    dest_path=('TEM', 'operation_mode'), cast_fn=str,
-                    units=None, conv_fn=None, override=True),
-
-                # try two different extractions of defocus for mag mode and
-                # diffraction mode:
-                MappingElements(
-                    source_dict={
-                        'Defocus':
-                            __extract_val(r'Defocus \(um\) (.*) Magn',
-                                          __find_val('Mode ', self.tecnai_info))},
-                    source_path='Defocus', dest_dict=self.em,
-                    dest_path=('TEM', 'defocus'), cast_fn=float,
-                    units='MicroM', conv_fn=None, override=True),
-                MappingElements(
-                    source_dict={
-                        'Defocus':
-                            __extract_val(r'Defocus ([\d|\.]*) CL',
-                                          __find_val('Mode ', self.tecnai_info))},
-                    source_path='Defocus', dest_dict=self.em,
-                    dest_path=('TEM', 'defocus'), cast_fn=float,
-                    units='MicroM', conv_fn=None, override=True),
-                # try magnification (not always present):
-                MappingElements(
-                    source_dict={
-                        'Magnification':
-                            __extract_val(r'Magn (\d*)x', __find_val('Mode ', self.tecnai_info))},
-                    source_path='Magnification', dest_dict=self.em,
-                    dest_path=('General_EM', 'magnification_indicated'),
-                    cast_fn=int, units='UNITLESS', conv_fn=None,
-                    override=True),
-                MappingElements(
-                    source_dict={
-                        'Camera_Length':
-                            __extract_val(r'CL (.*)m', __find_val('Mode ', self.tecnai_info))},
-                    source_path='Camera_Length', dest_dict=self.em,
-                    dest_path=('TEM', 'camera_length'), cast_fn=float,
-                    units='MilliM', conv_fn=lambda x: x*1000, override=True),
-                # spot size
-                MappingElements(
-                    source_dict={'Spot_Size': __find_val('Spot ', self.tecnai_info)},
-                    source_path='Spot_Size', dest_dict=self.em,
-                    dest_path=('TEM', 'spot_size'), cast_fn=int,
-                    units='UNITLESS', conv_fn=None, override=True),
-                # Tecnai has info about apertures and lens strengths,
-                # but not extracting here (see NexusLIMS code for example)
-            ]
-            stage_vals = __find_val('Stage', self.tecnai_info)
-            if stage_vals:
-                x, y, z = re.findall(r' (-?\d*\.\d*) um', stage_vals)
-                alpha, beta = re.findall(r' (-?\d*\.\d*) deg', stage_vals)
-                stage = {'x': x, 'y': y, 'z': z, 'a': alpha, 'b': beta}
-                mapping += [
-                    MappingElements(
-                        source_dict=stage, source_path='x', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'x'),
-                        cast_fn=float, units='MicroM', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=stage, source_path='y', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'y'),
-                        cast_fn=float, units='MicroM', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=stage, source_path='z', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'z'),
-                        cast_fn=float, units='MicroM', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=stage, source_path='a', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                        cast_fn=float, units='DEG', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=stage, source_path='b', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                        cast_fn=float, units='DEG', conv_fn=None, override=True),
-                ]
+            found = _scan_tecnai_info(self.tecnai_info)
+
+            raws = {
+                'Microscope_Name': found.get('Microscope '),
+                'Extractor_Voltage': __extract_val(_RE_EXTR_VOLT, found.get('Extr volt ')),
+                'Emission_Current': __extract_val(_RE_EMISSION, found.get('Emission ')),
+                'Operation_Mode': __extract_val(_RE_OPERATION_MODE, found.get('Mode ')),
+                # one pattern covers defocus in both mag mode and diffraction mode
+                'Defocus': __extract_val(_RE_DEFOCUS, found.get('Mode ')),
+                # magnification is not always present
+                'Magnification': __extract_val(_RE_MAGN, found.get('Mode ')),
+                'Camera_Length': __extract_val(_RE_CL, found.get('Mode ')),
+                'Spot_Size': found.get('Spot '),
+            }
+            stage_vals = found.get('Stage')
+            stage_match = _RE_STAGE.search(stage_vals) if stage_vals else None
+            if stage_match is not None:
+                raws.update(zip(('x', 'y', 'z', 'a', 'b'), stage_match.groups()))
 
             # process EELS spectrometer info from Tecnai string
-            if __find_val('Filter related settings', self.tecnai_info):
-                filter_dict = {
-                    'Mode': __find_val('Mode: ', self.tecnai_info),
-                    'Dispersion': __extract_val(r'(.*)\[eV/Channel\]',
-                                                __find_val('Selected dispersion: ',
-                                                           self.tecnai_info)),
-                    'Aperture': __extract_val(r'(\d*)mm',
-                                              __find_val('Selected aperture: ',
-                                                         self.tecnai_info)),
-                    'Prism': __extract_val(r'(.*)\[eV\]',
-                                           __find_val('Prism shift: ', self.tecnai_info)),
-                    'Drift': __extract_val(r'(.*)\[eV\]',
-                                           __find_val('Drift tube: ', self.tecnai_info)),
-                    'TotalLoss': __extract_val(r'(.*)\[eV\]',
-                                               __find_val('Total energy loss: ', self.tecnai_info))
-                }
-                mapping += [
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Mode',
-                        dest_dict=self.em, dest_path=('EELS', 'spectrometer_mode'),
-                        cast_fn=str, units=None, conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Dispersion',
-                        dest_dict=self.em, dest_path=('EELS', 'dispersion_per_channel'),
-                        cast_fn=float, units='EV', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Aperture',
-                        dest_dict=self.em, dest_path=('EELS', 'aperture_size'),
-                        cast_fn=float, units='MilliM', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Drift',
-                        dest_dict=self.em, dest_path=('EELS', 'drift_tube_energy'),
-                        cast_fn=float, units='EV', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Prism',
-                        dest_dict=self.em, dest_path=('EELS', 'prism_shift_energy'),
-                        cast_fn=float, units='EV', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='TotalLoss',
-                        dest_dict=self.em, dest_path=('EELS', 'total_energy_loss'),
-                        cast_fn=float, units='EV', conv_fn=None, override=True),
-                ]
-
-            map_dict_values(mapping)
-
-    def _tia_info(self) -> None:
+            if found.get('Filter related settings'):
+                raws.update({
+                    'Mode': found.get('Mode: '),
+                    'Dispersion': __extract_val(_RE_DISPERSION,
+                                                found.get('Selected dispersion: ')),
+                    'Aperture': __extract_val(_RE_APERTURE, found.get('Selected aperture: ')),
+                    'Prism': __extract_val(_RE_EV, found.get('Prism shift: ')),
+                    'Drift': __extract_val(_RE_EV, found.get('Drift tube: ')),
+                    'TotalLoss': __extract_val(_RE_EV, found.get('Total energy loss: ')),
+                })
+
+            # only map the values that were actually found in the string
+            return _bind([spec for spec in _TECNAI_SPECS
+                          if raws.get(spec.source_path) is not None], raws, self.em)
+
+    def _tia_info(self) -> List[MappingElements]:
         """Parses information commonly found in .ser/.emi files produced by the "Tecnai Imaging
         and Analysis" (TIA) software
 
@@ -833,244 +792,21 @@ class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
         to acquisition modality (i.e. could be EELS or EDS), so we do not extract those into our
         metadata hierarchy
         """
+        object_info = self.raw_meta.get('ObjectInfo')
+        if not object_info:
+            # not a TIA file, so there is nothing to map
+            return []
+        return _bind(_TIA_SPECS, object_info, self.em)
 
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalConditions',
-                             'MicroscopeConditions', 'AcceleratingVoltage'),
-                dest_dict=self.em, dest_path=('General_EM', 'accelerating_voltage'),
-                cast_fn=float, units='V', conv_fn=None, override=False),
-
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'AcquireInfo', 'DwellTimePath'),
-                dest_dict=self.em, dest_path=('General_EM', 'dwell_time'),
-                cast_fn=float, units='SEC', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'AcquireInfo', 'FrameTime'),
-                dest_dict=self.em, dest_path=('General_EM', 'frame_time'),
-                cast_fn=float, units='SEC', conv_fn=None, override=False),
-
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Microscope'),
-                dest_dict=self.em, dest_path=('General_EM', 'microscope_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'High tension_kV'),
-                dest_dict=self.em, dest_path=('General_EM',
-                                              'accelerating_voltage'),
-                cast_fn=float, units='KiloV', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Emission_uA'),
-                dest_dict=self.em, dest_path=('General_EM', 'emission_current'),
-                cast_fn=float, units='MicroA', conv_fn=None, override=False),
-            # this value is often more specific than the one from HyperSpy,
-            # so override acquisition mode:
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Mode'),
-                dest_dict=self.em, dest_path=('General_EM', 'acquisition_mode'),
-                cast_fn=str, units=None, conv_fn=lambda x: x.strip(), override=True),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Defocus_um'),
-                dest_dict=self.em, dest_path=('TEM', 'defocus'),
-                cast_fn=float, units='MicroM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Magnification_x'),
-                dest_dict=self.em, dest_path=('General_EM', 'magnification_indicated'),
-                cast_fn=float, units='UNITLESS', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Camera length_m'),
-                dest_dict=self.em, dest_path=('TEM', 'camera_length'),
-                cast_fn=float, units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Spot size'),
-                dest_dict=self.em, dest_path=('TEM', 'spot_size'),
-                cast_fn=int, units='UNITLESS', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Stage X_um'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'x'),
-                cast_fn=float, units='MicroM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Stage Y_um'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'y'),
-                cast_fn=float, units='MicroM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Stage Z_um'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'z'),
-                cast_fn=float, units='MicroM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Stage A_deg'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                cast_fn=float, units='DEG', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Stage B_deg'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                cast_fn=float, units='DEG', conv_fn=None, override=False),
-
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Filter mode'),
-                dest_dict=self.em, dest_path=('EELS', 'spectrometer_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'Filter selected dispersion_eV/Channel'),
-                dest_dict=self.em, dest_path=('EELS', 'dispersion_per_channel'),
-                cast_fn=float, units='EV', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Filter selected aperture'),
-                dest_dict=self.em, dest_path=('EELS', 'aperture_size'),
-                cast_fn=lambda x: float(x.replace('mm', '')), units='MilliM', conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Filter prism shift_eV'),
-                dest_dict=self.em, dest_path=('EELS', 'prism_shift_energy'),
-                cast_fn=float, units='EV', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Filter drift tube_eV'),
-                dest_dict=self.em, dest_path=('EELS', 'drift_tube_energy'),
-                cast_fn=float, units='EV', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'Filter total energy loss_eV'),
-                dest_dict=self.em, dest_path=('EELS', 'total_energy_loss'),
-                cast_fn=float, units='EV', conv_fn=None, override=False)
-        ]
-        map_dict_values(mapping)
-
-    def _tiff_info(self) -> None:
+    def _tiff_info(self) -> List[MappingElements]:
         """Parses metadata found in FEI/ThermoFisher tiff formats (and perhaps others in the
         future), produced by SEM and dual beam tools
         """
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'System', 'Software'),
-                dest_dict=self.em, dest_path=('General_EM', 'acquisition_software_version'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Beam', 'Spot'),
-                dest_dict=self.em, dest_path=('SEM', 'spot_size'),
-                cast_fn=lambda x: int(x) if x != '' else None, units=None, conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Beam', 'HV'),
-                dest_dict=self.em, dest_path=('General_EM', 'accelerating_voltage'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='KiloV',
-                conv_fn=lambda x: x/1000 if x != '' else None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'EBeam', 'HV'),
-                dest_dict=self.em, dest_path=('General_EM', 'accelerating_voltage'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='KiloV', conv_fn=lambda x: x / 1000 if x != '' else None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'EBeam', 'HFW'),
-                dest_dict=self.em, dest_path=('SEM', 'horizontal_field_width'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='M', conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'EBeam', 'VFW'),
-                dest_dict=self.em, dest_path=('SEM', 'vertical_field_width'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='M', conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'EBeam', 'WD'),
-                dest_dict=self.em, dest_path=('SEM', 'working_distance'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='M', conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'EBeam', 'BeamCurrent'),
-                dest_dict=self.em, dest_path=('General_EM', 'beam_current'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='A', conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Stage', 'StageX'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'x'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='MilliM',
-                conv_fn=lambda x: x * 1000 if x != '' else None, override=True),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Stage', 'StageY'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'y'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='MilliM',
-                conv_fn=lambda x: x * 1000 if x != '' else None, override=True),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Stage', 'StageZ'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'z'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='MilliM',
-                conv_fn=lambda x: x * 1000 if x != '' else None, override=True),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Stage', 'StageR'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'rotation'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='DEG', conv_fn=None,
-                override=True),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Stage', 'StageT'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='DEG', conv_fn=None,
-                override=True),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Stage', 'StageTb'),
-                dest_dict=self.em, dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='DEG', conv_fn=None,
-                override=True),
-
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Scan', 'PixelWidth'),
-                dest_dict=self.em, dest_path=('SEM', 'pixel_width'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='M', conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Scan', 'PixelHeight'),
-                dest_dict=self.em, dest_path=('SEM', 'pixel_height'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='M', conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Scan', 'HorFieldsize'),
-                dest_dict=self.em, dest_path=('SEM', 'horizontal_field_width'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Scan', 'VerFieldsize'),
-                dest_dict=self.em, dest_path=('SEM', 'vertical_field_width'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Scan', 'FrameTime'),
-                dest_dict=self.em, dest_path=('General_EM', 'frame_time'),
-                cast_fn=lambda x: float(x) if x else None, units='SEC', conv_fn=None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Image',
-                                                        'MagnificationMode'),
-                dest_dict=self.em, dest_path=('SEM', 'magnification_mode'),
-                cast_fn=None, units=None, conv_fn=None, override=False),
-            # confirmed in Quanta SEM manual that the pressure units are Pascals
-            MappingElements(
-                source_dict=self.raw_meta, source_path=('fei_metadata', 'Vacuum', 'ChPressure'),
-                dest_dict=self.em, dest_path=('SEM', 'chamber_pressure'),
-                cast_fn=lambda x: float(x) if x else None, units='PA', conv_fn=None, override=False)
-        ]
-        map_dict_values(mapping)
+        fei_metadata = self.raw_meta.get('fei_metadata')
+        if not fei_metadata:
+            # not an FEI tiff, so there is nothing to map
+            return []
+        return _bind(_TIFF_SPECS, fei_metadata, self.em)
 
     def implementors(self):
         return ['Jonathon Gaff <jgaff@uchicago.edu>',
@@ -1082,6 +818,4 @@ class ElectronMicroscopyExtractor(BaseSingleFileExtractor):
     @property
     def schema(self) -> dict:
         """Schema for the output of the parser"""
-        with open(pathlib.Path(__file__).parent / 'schemas' /
-                  'electron_microscopy.json') as f:
-            return json.load(f)
+        return _load_schema()
@@ -1,7 +1,9 @@
 from scythe.base import BaseSingleFileExtractor
-from hashlib import sha512
+from functools import lru_cache
+import hashlib
 from warnings import warn
 import json
+import mmap
 import os
 
 
@@ -16,44 +18,153 @@ except ImportError as e:
              'If desired, call: https://github.com/ahupp/python-magic#installation')
     magic = None
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    from hashlib import file_digest
+except ImportError:  # Python < 3.11
+    file_digest = None
+
+# Algorithms that hashlib provides on every platform, excluding the SHAKE variants whose digests
+#  need an explicit length
+_HASHLIB_ALGS = frozenset(a for a in hashlib.algorithms_guaranteed if not a.startswith('shake_'))
+
+# Bounds on the read size for hashing when ``hashlib.file_digest`` is unavailable. Within them,
+#  the file is read in a single request if it fits
+_MIN_HASH_BLOCK_SIZE = 1 << 16
+_MAX_HASH_BLOCK_SIZE = 1 << 22
+
+# Files with more than this many bytes are memory mapped rather than read for hashing
+_HASH_MMAP_THRESHOLD = 1 << 20
+
+@lru_cache(maxsize=2)
+def _get_magic(mime):
+    """Get a libmagic wrapper, loading the magic database once per process
+
+    Args:
+        mime (bool): Whether the wrapper should return MIME types rather than descriptions
+    Returns:
+        (magic.Magic) Wrapper to use for identifying file types
+    """
+    return magic.Magic(mime=mime)
+
+
+@lru_cache(maxsize=1)
+def _load_schema():
+    with open(os.path.join(os.path.dirname(__file__), 'schemas', 'file.json')) as fp:
+        return json.load(fp)
+
 
 class GenericFileExtractor(BaseSingleFileExtractor):
     """Gather basic file information"""
 
-    def __init__(self, store_path=True, compute_hash=True):
+    def __init__(self, store_path=True, compute_hash=True, hash_alg='sha512'):
         """
         Args:
             store_path (bool): Whether to record the path of the file
             compute_hash (bool): Whether to compute the hash of a file
+            hash_alg (str): Hash algorithm to use, either ``'blake3'`` or any algorithm that
+                :mod:`hashlib` always provides (e.g., ``'sha512'``, ``'sha256'``).
+                The digest is stored under a key with the same name. BLAKE3 is much
+                faster on large files but requires the ``blake3`` package. Of the hashlib
+                algorithms, ``'sha256'`` is fastest on CPUs with SHA extensions
         """
         super().__init__()
+        if hash_alg not in _HASHLIB_ALGS and hash_alg != 'blake3':
+            raise ValueError('Unsupported hash algorithm: {}'.format(hash_alg))
+        if hash_alg == 'blake3' and blake3 is None:
+            raise ValueError('The blake3 package is required to use hash_alg="blake3". '
+                             'If desired, call: pip install blake3')
         self.store_path = store_path
         self.compute_hash = compute_hash
+        self.hash_alg = hash_alg
 
     def _extract_file(self, path, context=None):
+        if magic is None and not self.compute_hash:
+            # Nothing needs the contents, so do not open the file
+            return self._file_info(path, os.path.getsize(path))
+
+        # Open the file once for both libmagic and the hash
+        with open(path, 'rb', buffering=0) as fp:
+            # Get the size from the open descriptor rather than looking up the path again
+            size = os.fstat(fp.fileno()).st_size
+            output = self._file_info(path, size)
+
+            # If magic imported properly, use it. libmagic reads from the descriptor the same way
+            #  it reads from a path (e.g., checking the end of the file for some formats)
+            if magic is not None:
+                output["mime_type"] = _get_magic(True).from_descriptor(fp.fileno())
+                output["data_type"] = _get_magic(False).from_descriptor(fp.fileno())
+                fp.seek(0)
+
+            if self.compute_hash:
+                output[self.hash_alg] = self._hash_file(fp, size)
+        return output
+
+    def _file_info(self, path, size):
+        """Get the information about a file that does not require reading it
+
+        Args:
+            path (str): Path to the file
+            size (int): Size of the file in bytes
+        Returns:
+            (dict) Length, name and, if requested, path of the file
+        """
         output = {
-            "length": os.path.getsize(path),
+            "length": size,
             "filename": os.path.basename(path),
         }
-
-        # If magic imported properly, use it
-        if magic is not None:
-            output["mime_type"] = magic.from_file(path, mime=True)
-            output["data_type"] = magic.from_file(path)
-
         if self.store_path:
             output['path'] = path
-        if self.compute_hash:
-            sha = sha512()
-            with open(path, 'rb') as fp:
-                while True:
-                    data = fp.read(65536)
-                    if not data:
-                        break
-                    sha.update(data)
-            output['sha512'] = sha.hexdigest()
         return output
 
+    def _hash_file(self, fp, size):
+        """Compute the digest of an open file
+
+        Args:
+            fp: File object opened in binary mode, positioned at the start of the file
+            size (int): Size of the file in bytes
+        Returns:
+            (str) Hex digest of the file contents
+        """
+        if self.hash_alg == 'blake3':
+            # Hash a memory map of the whole file with multiple threads
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            if size > 0:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            return hasher.hexdigest()
+
+        # The named constructors use OpenSSL, which picks the fastest implementation for the CPU
+        new_hash = getattr(hashlib, self.hash_alg)
+        if size > _HASH_MMAP_THRESHOLD:
+            # Hash the file directly from the page cache, without copying it
+            hasher = new_hash()
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mm)
+            return hasher.hexdigest()
+
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if file_digest is not None:
+            return file_digest(fp, new_hash).hexdigest()
+        hasher = new_hash()
+        block_size = min(max(size, _MIN_HASH_BLOCK_SIZE), _MAX_HASH_BLOCK_SIZE)
+        # Read into one reused buffer rather than allocating a new bytes object for each block
+        buffer = bytearray(block_size)
+        view = memoryview(buffer)
+        while True:
+            n_read = fp.readinto(buffer)
+            if not n_read:
+                break
+            hasher.update(view[:n_read])
+        return hasher.hexdigest()
+
     def implementors(self):
         return ['Logan Ward']
 
@@ -62,5 +173,4 @@ class GenericFileExtractor(BaseSingleFileExtractor):
 
     @property
     def schema(self):
-        with open(os.path.join(os.path.dirname(__file__), 'schemas', 'file.json')) as fp:
-            return json.load(fp)
+        return _load_schema()
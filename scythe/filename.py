@@ -1,9 +1,24 @@
 import os
 import re
+from functools import lru_cache
 
 from mdf_toolbox import flatten_json
 
 from scythe.base import BaseSingleFileExtractor
+from scythe.utils import set_nested_dict_value
+
+
+@lru_cache(maxsize=32)
+def _compile_mapping(items):
+    """Compile the patterns of a filename mapping, once per distinct mapping
+
+    Args:
+        items (tuple): Pairs of the flattened JSON path and the pattern for that field
+    Returns:
+        (tuple) Pairs of the JSON path, split into a tuple of keys, and the compiled pattern
+    """
+    return tuple((tuple(json_path.split(".")), re.compile(pattern))
+                 for json_path, pattern in items)
 
 
 class FilenameExtractor(BaseSingleFileExtractor):
@@ -21,19 +36,12 @@ class FilenameExtractor(BaseSingleFileExtractor):
 
         record = {}
         filename = os.path.basename(path)
-        for json_path, pattern in flatten_json(context["mapping"]).items():
-            match = re.search(pattern, filename)
+        mapping = _compile_mapping(tuple(flatten_json(context["mapping"]).items()))
+        for dest_path, pattern in mapping:
+            match = pattern.search(filename)
             if match:
-                fields = json_path.split(".")
-                last_field = fields.pop()
-                current_field = record
-                # Create all missing fields
-                for field in fields:
-                    if current_field.get(field) is None:
-                        current_field[field] = {}
-                    current_field = current_field[field]
-                # Add value to end
-                current_field[last_field] = match.group()
+                # Create all missing fields, and add value to end
+                set_nested_dict_value(record, dest_path, match.group(), override=True)
         return record
 
     def implementors(self):
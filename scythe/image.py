@@ -7,17 +7,21 @@ class ImageExtractor(BaseSingleFileExtractor):
     """Retrieves basic information about an image"""
 
     def _extract_file(self, file_path, context=None):
-        im = Image.open(file_path)
+        # Only the header is read; closing the file avoids leaving the handle to the GC
+        with Image.open(file_path) as im:
+            width, height = im.size
+            image_format = im.format
+            n_bands = Image.getmodebands(im.mode)
         return {
             "image": {
-                "width": im.width,
-                "height": im.height,
-                "format": im.format,
-                "megapixels": (im.width * im.height) / 1000000,
+                "width": width,
+                "height": height,
+                "format": image_format,
+                "megapixels": (width * height) / 1000000,
                 "shape": [
-                    im.height,
-                    im.width,
-                    len(im.getbands())
+                    height,
+                    width,
+                    n_bands
                 ]
             }
         }
@@ -4,6 +4,32 @@ from mdf_toolbox import translate_json
 
 from scythe.base import BaseSingleFileExtractor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(path):
+    """Parse a JSON file, using orjson if it is installed
+
+    Args:
+        path (str): Path to the file
+    Returns:
+        The parsed contents of the file
+    """
+    # Read as bytes, as both parsers decode UTF-8 themselves
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library (e.g., it rejects NaN and
+            #  integers beyond 64 bits), so give the file a second chance
+            pass
+    return json.loads(data)
+
 
 class JSONExtractor(BaseSingleFileExtractor):
     """Extracts fields in JSON into a user-defined new schema."""
@@ -17,8 +43,7 @@ class JSONExtractor(BaseSingleFileExtractor):
         """
         if not context.get("mapping"):
             raise ValueError("Mapping is required for the JSONExtractor.")
-        with open(path) as f:
-            file_json = json.load(f)
+        file_json = _load_json(path)
         return translate_json(file_json, context["mapping"],
                               na_values=context.get("na_values", None))
 
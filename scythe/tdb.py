@@ -18,12 +18,9 @@ class TDBExtractor(BaseSingleFileExtractor):
         calphad = {}
         # Attempt to read the file
         calphad_db = pycalphad.Database(path)
-        composition = ""
-        for element in calphad_db.elements:
-            if element.isalnum():
-                element = element.lower()
-                element = element[0].upper() + element[1:]
-                composition += element
+        # Skip placeholder species (e.g., "/-" for electrons) and write elements as "Fe"
+        composition = "".join(element.capitalize() for element in calphad_db.elements
+                              if element.isalnum())
 
         phases = list(calphad_db.phases.keys())
 
@@ -1,9 +1,14 @@
 """Parsers used for testing purposes"""
 
 from scythe.base import BaseExtractor
+from collections import defaultdict
 from typing import Iterable
 import os
 
+# Directories holding at least this many files of a group are listed once, rather than
+#  checking for each file separately
+_SCANDIR_MIN_FILES = 32
+
 
 class NOOPExtractor(BaseExtractor):
     """Determine whether files exist, used for debugging
@@ -14,7 +19,25 @@ class NOOPExtractor(BaseExtractor):
     """
 
     def extract(self, group: Iterable[str], context: dict = None):
-        return dict((f, os.path.exists(f)) for f in group)
+        group = list(group)
+        by_dir = defaultdict(list)
+        for f in group:
+            by_dir[os.path.dirname(f)].append(f)
+
+        found = set()
+        for directory, files in by_dir.items():
+            if len(files) < _SCANDIR_MIN_FILES:
+                continue
+            try:
+                with os.scandir(directory or os.curdir) as entries:
+                    # Symbolic links may be broken, so those are checked with os.path.exists
+                    names = {e.name for e in entries if not e.is_symlink()}
+            except OSError:
+                continue
+            found.update(f for f in files if os.path.basename(f) in names)
+
+        # Only files that were listed are assumed to exist; check the rest directly
+        return dict((f, f in found or os.path.exists(f)) for f in group)
 
     def version(self):
         return '0.0.1'
@@ -1,8 +1,109 @@
 from typing import Dict, Union, Tuple, Any, Callable, Optional, List, TypedDict
+from collections.abc import Mapping
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Containers that are treated as missing values when empty
+_EMPTY_TYPES = (Mapping, list, str)
+
+
+def _is_empty(value: Any) -> bool:
+    """Whether a value is ``None`` or an empty mapping, list, or string"""
+    return value is None or (isinstance(value, _EMPTY_TYPES) and not value)
+
+
+@lru_cache(maxsize=1024)
+def _path_getter(path: Union[Tuple, str]) -> Callable[[Any], Any]:
+    """Build a function that walks a fixed path into a nested dictionary structure
+
+    Mapping paths are static, so the getter for each one is built once and reused.
+
+    Args:
+        path: A string or tuple of the subsequent keys to traverse
+    Returns:
+        A function that takes the nested structure and returns the value at ``path``, or
+        ``None`` if any key along the path is missing
+    """
+    if isinstance(path, str):
+        path = (path,)
+
+    if len(path) == 1:
+        key, = path
+
+        def getter(sub_dict):
+            if isinstance(sub_dict, Mapping):
+                return sub_dict.get(key)
+            try:
+                return sub_dict[key]
+            except KeyError:
+                return None
+        return getter
+
+    def walk(sub_dict):
+        for key in path:
+            if isinstance(sub_dict, Mapping):
+                # missing keys are the common case when probing for optional metadata, so use
+                # .get() rather than raising (and catching) a KeyError for each of them
+                sub_dict = sub_dict.get(key)
+                if sub_dict is None:
+                    return None
+            else:
+                try:
+                    sub_dict = sub_dict[key]
+                except KeyError:
+                    return None
+        return sub_dict
+
+    if len(path) != 2:
+        return walk
+    first, second = path
+
+    def getter(sub_dict):
+        # most mapping paths are a group and a key within it, so look those up without the loop
+        # and only fall back to it for containers that are not mappings
+        if isinstance(sub_dict, Mapping):
+            child = sub_dict.get(first)
+            if isinstance(child, Mapping):
+                return child.get(second)
+            if child is None:
+                return None
+        return walk(sub_dict)
+    return getter
+
+
+@lru_cache(maxsize=1024)
+def _path_setter(path: Union[Tuple, str]) -> Callable[[Dict, Any, bool], None]:
+    """Build a function that sets a value at a fixed path within a nested dictionary
+
+    Args:
+        path: A string or tuple of the subsequent keys leading to the value
+    Returns:
+        A function that takes the nested dictionary, the value, and whether to override an
+        existing value. Intermediate dictionaries are created as needed, and the destination is
+        only walked once
+    """
+    if isinstance(path, str):
+        path = (path,)
+    parents, leaf = path[:-1], path[-1]
+
+    def setter(nest_dict, value, override=False):
+        for key in parents:
+            nest_dict = nest_dict.setdefault(key, {})
+        # only set the value if it was None, or we chose to override
+        if override or _is_empty(nest_dict.get(leaf)):
+            nest_dict[leaf] = value
+    return setter
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: Union[Tuple, str]) -> Tuple[Tuple, Any]:
+    """Split a destination path into the path to its parent and the final key"""
+    if isinstance(path, str):
+        return (), path
+    return tuple(path[:-1]), path[-1]
+
 
 def get_nested_dict_value_by_path(nest_dict: Dict,
                                   path: Union[Tuple, str],
@@ -23,19 +124,15 @@ def get_nested_dict_value_by_path(nest_dict: Dict,
         The value at the path within the nested dictionary; if there's no
         value there, return ``None``
     """
-    sub_dict = nest_dict
-
-    if isinstance(path, str):
-        path = (path,)
-
-    for key in path:
-        try:
-            sub_dict = sub_dict[key]
-        except KeyError:
-            return None
+    try:
+        getter = _path_getter(path)
+    except TypeError:
+        # unhashable paths (e.g., lists) cannot be cached directly
+        getter = _path_getter(tuple(path))
+    sub_dict = getter(nest_dict)
 
     # coerce empty values to None
-    if sub_dict in [{}, dict(), [], '', None]:
+    if _is_empty(sub_dict):
         return None
 
     if cast is not None:
@@ -68,13 +165,13 @@ def set_nested_dict_value(nest_dict: Dict, path: Tuple,
     """
     if value is None:
         return
-    orig_value = get_nested_dict_value_by_path(nest_dict, path)
-    for key in path[:-1]:
-        nest_dict = nest_dict.setdefault(key, {})
-    if orig_value is None or \
-            orig_value is not None and override:
-        # only set the value if it was None, or we chose to override
-        nest_dict[path[-1]] = value
+    # walks the path once, and only inspects the existing value when not overriding
+    try:
+        setter = _path_setter(path)
+    except TypeError:
+        # unhashable paths (e.g., lists) cannot be cached directly
+        setter = _path_setter(tuple(path))
+    setter(nest_dict, value, override)
 
 
 def set_nested_dict_value_with_units(nest_dict: Dict, path: Tuple,
@@ -142,19 +239,81 @@ def map_dict_values(mapping: List[MappingElements]):
                  'conv_fn': lambda x: x,
                  'override': bool}
             ]
+            ``cast_fn``, ``units``, ``conv_fn`` and ``override`` may be omitted. The
+            entries themselves are not modified
     """
+    # bind the helpers locally, since this loop runs for every entry of every file
+    get_value = get_nested_dict_value_by_path
+    path_getter = _path_getter
+    split_path = _split_path
+
+    # many destinations share a parent (e.g., the stage position), so each parent dict is
+    # resolved once and reused by every entry under it
+    parents = {}
     for m in mapping:
-        m.setdefault('cast_fn', None)
-        m.setdefault('units', None)
-        m.setdefault('conv_fn', None)
+        get = m.get
+        dest_dict = m['dest_dict']
+        dest_path = m['dest_path']
+        try:
+            parent_path, leaf = split_path(dest_path)
+        except TypeError:
+            # unhashable paths (e.g., lists) cannot be cached directly
+            parent_path, leaf = split_path(tuple(dest_path))
+        parent_key = (id(dest_dict), parent_path)
+        parent = parents.get(parent_key)
+        if parent is None:
+            # only look for the parent here; it is created once there is a value to put in it
+            parent = path_getter(parent_path)(dest_dict)
+            if parent is not None:
+                parents[parent_key] = parent
+
+        override = get('override', False)
+        if not override and parent is not None and not _is_empty(parent.get(leaf)):
+            # an earlier entry already set this destination, and it would be kept anyway
+            continue
+
+        value = get_value(m['source_dict'], m['source_path'], get('cast_fn'))
+        if value is None:
+            continue
+
+        conv_fn = get('conv_fn')
+        if conv_fn is not None:
+            value = conv_fn(value)
+        to_set = {'value': value}
+        units = get('units')
+        if units is not None:
+            to_set['units'] = units
 
-        value = get_nested_dict_value_by_path(
-            nest_dict=m['source_dict'],
-            path=m['source_path'],
-            cast=m['cast_fn'])
-        set_nested_dict_value_with_units(
-            nest_dict=m['dest_dict'], path=m['dest_path'], value=value,
-            units=m['units'], fn=m['conv_fn'], override=m['override'])
+        if parent is None:
+            parent = dest_dict
+            for key in parent_path:
+                parent = parent.setdefault(key, {})
+            parents[parent_key] = parent
+        if override or _is_empty(parent.get(leaf)):
+            parent[leaf] = to_set
+
+
+# Typically seen unit representations, and their standardized representation from QUDT
+_UNIT_MAP = {
+    # length
+    'km': 'KiloM', 'cm': 'CentiM', 'm': 'M', 'mm': 'MilliM',
+    'µm': 'MicroM', 'um': 'MicroM', 'nm': 'NanoM', 'pm': 'PicoM',
+    'Å': 'ANGSTROM',
+    # current
+    'A': 'A', 'mA': 'MilliA', 'nA': 'NanoA', 'pA': 'PicoA',
+    'µA': 'MicroA', 'uA': 'MicroA',
+    # energy
+    'eV': 'EV', 'GeV': 'GigaEV', 'keV': 'KiloEV', 'MeV': 'MegaEV',
+    # mass
+    'g': 'GM', 'kg': 'KiloGM',
+    # potential
+    'V': 'V', 'kV': 'KiloV', 'MV': 'MegaV', 'mV': 'MilliV',
+    'uV': 'MicroV', 'µV': 'MicroV',
+    # inverse lengths
+    '1/nm': 'PER-NanoM', '1/mm': 'PER-MilliM', '1/m': 'PER-M',
+    '1/cm': 'PER-CentiM', '1/um': 'PER-MicroM', '1/µm': 'PER-MicroM',
+    '1/pm': 'PER-PicoM'
+}
 
 
 def standardize_unit(u: str) -> str:
@@ -172,27 +331,4 @@ def standardize_unit(u: str) -> str:
         The unit in a QUDT-standard representation (if known; otherwise just
         returns the unit representation as provided)
     """
-    mapping = {
-        # length
-        'km': 'KiloM', 'cm': 'CentiM', 'm': 'M', 'mm': 'MilliM',
-        'µm': 'MicroM', 'um': 'MicroM', 'nm': 'NanoM', 'pm': 'PicoM',
-        'Å': 'ANGSTROM',
-        # current
-        'A': 'A', 'mA': 'MilliA', 'nA': 'NanoA', 'pA': 'PicoA',
-        'µA': 'MicroA', 'uA': 'MicroA',
-        # energy
-        'eV': 'EV', 'GeV': 'GigaEV', 'keV': 'KiloEV', 'MeV': 'MegaEV',
-        # mass
-        'g': 'GM', 'kg': 'KiloGM',
-        # potential
-        'V': 'V', 'kV': 'KiloV', 'MV': 'MegaV', 'mV': 'MilliV',
-        'uV': 'MicroV', 'µV': 'MicroV',
-        # inverse lengths
-        '1/nm': 'PER-NanoM', '1/mm': 'PER-MilliM', '1/m': 'PER-M',
-        '1/cm': 'PER-CentiM', '1/um': 'PER-MicroM', '1/µm': 'PER-MicroM',
-        '1/pm': 'PER-PicoM'
-    }
-    if u in mapping:
-        return mapping[u]
-    else:
-        return u
+    return _UNIT_MAP.get(u, u)
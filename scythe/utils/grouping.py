@@ -1,8 +1,7 @@
 """Utilities for implementing grouping operations"""
-from typing import Union, List, Iterable, Tuple
-from operator import itemgetter
+from typing import Union, List, Iterable, Tuple, Sequence, Dict, Optional
+from collections import defaultdict
 from pathlib import Path
-import itertools
 import os
 
 
@@ -21,11 +20,39 @@ def preprocess_paths(paths: Union[str, Path, List[str], List[Path]]) -> List[str
     if isinstance(paths, (str, Path)):
         paths = [paths]
 
-    # Make paths absolute
-    return [os.path.abspath(os.path.expanduser(f)) for f in paths]
+    # Make paths absolute. This matches os.path.abspath(os.path.expanduser(f)), but looks up the
+    #  working directory once for all paths and only expands those that start with "~"
+    cwd = os.getcwd()
+    output = []
+    for f in paths:
+        f = os.fspath(f)
+        if f.startswith('~'):
+            f = os.path.expanduser(f)
+        output.append(os.path.normpath(f if os.path.isabs(f) else os.path.join(cwd, f)))
+    return output
 
 
-def group_by_postfix(files: Iterable[str], vocabulary: List[str]) -> Iterable[Tuple[str, ...]]:
+def _first_prefix(name: str, by_length: List[Tuple[int, Dict[str, int]]]) -> Optional[int]:
+    """Find which vocabulary entry a name starts with, looking up each possible prefix length
+
+    Args:
+        name: String to be matched
+        by_length: Map of each vocabulary entry to its position, grouped by the length of the
+            entries, in order of increasing length
+    Returns:
+        Position of the earliest entry in the vocabulary that ``name`` starts with, or ``None``
+    """
+    best = None
+    for length, entries in by_length:
+        if length > len(name):
+            break
+        i = entries.get(name[:length])
+        if i is not None and (best is None or i < best):
+            best = i
+    return best
+
+
+def group_by_postfix(files: Iterable[str], vocabulary: Sequence[str]) -> Iterable[Tuple[str, ...]]:
     """Group files that have a common ending
 
     Finds all filenames that begin with a prefixes from a
@@ -48,27 +75,31 @@ def group_by_postfix(files: Iterable[str], vocabulary: List[str]) -> Iterable[Tu
 
     # TODO (lw): This function could be more flexible, but let's add features on demand
 
-    # Get the files with similar post-fixes and are from the user-defined vocabulary
-    matchable_files = []  # List of (path, type, (dir, postfix))
+    # Get the files with similar post-fixes and are from the user-defined vocabulary,
+    #  bucketed by directory and postfix in the order they were given
+    prefixes = tuple(vocabulary)  # lets str.startswith test every prefix in one call
+    by_length = defaultdict(dict)  # length -> {prefix: position in vocabulary}
+    for i, prefix in enumerate(prefixes):
+        by_length[len(prefix)].setdefault(prefix, i)
+    by_length = sorted(by_length.items())
+    groups = defaultdict(list)  # (dir, postfix) -> [path]
     for filename in files:
         # Find if the filename matches a known type
         name = os.path.basename(filename)
         name_lower = name.lower()
-        matches = [name_lower.startswith(n) for n in vocabulary]
-        if not any(matches):
+        if not name_lower.startswith(prefixes):
             continue
 
-        # Get the extension of the file
-        match_id = matches.index(True)
-        vtype = vocabulary[match_id]
+        # Get the extension of the file, using the first type in the vocabulary that matches.
+        #  Looking up the name's prefixes takes one step per distinct length of vocabulary entry,
+        #  rather than one per entry
+        vtype = prefixes[_first_prefix(name_lower, by_length)]
         ext = name[len(vtype):]
         d = os.path.dirname(filename)
 
-        # Add to the list
-        matchable_files.append((filename, vtype, (d, ext)))
+        # Add to the group
+        groups[(d, ext)].append(filename)
 
-    # Group files by postfix type and directory
-    sort_key = itemgetter(2)
-    for k, group in itertools.groupby(sorted(matchable_files, key=sort_key),
-                                      key=sort_key):
-        yield [x[0] for x in group]
+    # Yield the groups ordered by directory and postfix, which only requires sorting the keys
+    for key in sorted(groups):
+        yield groups[key]
@@ -1,7 +1,14 @@
-# we target 3.8+, so this should be okay without fallback to importlib_metadata
-import importlib.metadata
-
 # single source of truth for package version,
 # see https://packaging.python.org/en/latest/single_source_version/
 
-__version__ = importlib.metadata.version('scythe-extractors')
+
+def __getattr__(name):
+    # resolve the version on first access (PEP 562) rather than scanning the installed
+    # distributions every time the package is imported
+    if name == '__version__':
+        # we target 3.8+, so this should be okay without fallback to importlib_metadata
+        import importlib.metadata
+        version = importlib.metadata.version('scythe-extractors')
+        globals()['__version__'] = version  # later lookups skip this function
+        return version
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,4 +1,9 @@
+from scythe.adapters import base as adapters_base
 from scythe.adapters.base import NOOPAdapter, GreedySerializeAdapter
+from base64 import b64decode
+import numpy as np
+import pytest
+import json
 from scythe.testing import NOOPExtractor
 
 
@@ -24,3 +29,35 @@ def test_greedy_adapter_unserializable():
     unserializable_bytes = {'key': b'\x03\xdd'}
     s = adapter.transform(unserializable_bytes)
     assert s == '{"key": "<<Unserializable type: bytes>>"}'
+
+
+def test_compact_serialize():
+    adapter = GreedySerializeAdapter(compact=True)
+    assert adapter.transform({'key': [1, 2], 'bytes': b'\x03\xdd'}) == \
+        '{"key":[1,2],"bytes":"<<Unserializable type: bytes>>"}'
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_compact_serialize_special_values(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(adapters_base, 'orjson', None)
+    adapter = GreedySerializeAdapter(compact=True)
+
+    # Integers beyond 64 bits are written in either case
+    assert adapter.transform({'big': 2 ** 70}) == '{"big":%d}' % 2 ** 70
+
+    # orjson writes non-finite numbers as null
+    assert adapter.transform({'nan': float('nan')}) == \
+        ('{"nan":null}' if use_orjson else '{"nan":NaN}')
+
+
+def test_greedy_adapter_binary_arrays():
+    adapter = GreedySerializeAdapter(max_list_size=4)
+    data = {'small': np.arange(3), 'large': np.arange(12, dtype=float).reshape(3, 4)}
+    s = json.loads(adapter.transform(data))
+    assert s['small'] == [0, 1, 2]
+    large = s['large']
+    array = np.frombuffer(b64decode(large['__ndarray__']), large['dtype']).reshape(large['shape'])
+    assert np.array_equal(array, data['large'])
@@ -1,6 +1,8 @@
 from scythe.base import BaseExtractor, BaseSingleFileExtractor
 from glob import glob
+import threading
 import pytest
+import time
 import os
 
 
@@ -28,6 +30,21 @@ class FakeSingleParser(BaseSingleFileExtractor):
         return '0.0.0'
 
 
+class StatefulParser(BaseSingleFileExtractor):
+    """Keeps the file being parsed on the instance, like the electron microscopy extractor"""
+
+    def _extract_file(self, path, context=None):
+        self.path = path
+        time.sleep(0.001)  # give other threads the chance to overwrite the state
+        return {'path': self.path}
+
+    def implementors(self):
+        return ['Logan Ward']
+
+    def version(self):
+        return '0.0.0'
+
+
 @pytest.fixture
 def directory():
     return os.path.dirname(__file__)
@@ -53,6 +70,42 @@ def test_parse_dir(caplog, parser, directory, my_files):
     assert len(list(parser.extract_directory(directory))) == len(my_files)
 
 
+def test_parse_dir_threaded(parser, directory):
+    serial = list(parser.extract_directory(directory))
+    assert list(parser.extract_directory(directory, max_workers=4)) == serial
+    assert list(parser.extract_directory(directory, max_workers=2, use_processes=True)) == serial
+
+
+def test_parse_dir_threaded_stateful(directory):
+    parser = StatefulParser()
+    serial = list(parser.extract_directory(directory))
+    assert all(metadata == {'path': group[0]} for group, metadata in serial)
+    assert list(parser.extract_directory(directory, max_workers=8)) == serial
+
+
+def test_parse_dir_unpicklable(caplog, directory):
+    parser = StatefulParser()
+    parser.lock = threading.Lock()  # Cannot be pickled, so processes fall back to threads
+    serial = list(parser.extract_directory(directory))
+    assert list(parser.extract_directory(directory, max_workers=4, use_processes=True)) == serial
+    assert 'cannot be pickled' in caplog.text
+
+
+def test_parse_dir_threaded_lazy(parser):
+    drawn = []
+
+    def identify_files(path, context=None):
+        for i in range(1000):
+            drawn.append(i)
+            yield (str(i),)
+
+    parser.identify_files = identify_files
+    results = parser.extract_directory('.', max_workers=2)
+    assert next(results) == (('0',), {'group': ['0']})
+    assert len(drawn) < 100  # Only a few groups per thread are taken ahead of the consumer
+    assert len(list(results)) == 999
+
+
 def test_citations(parser):
     assert parser.citations() == []
 
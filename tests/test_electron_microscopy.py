@@ -2,7 +2,9 @@ import pytest
 import pathlib
 import jsonschema
 
-from scythe.electron_microscopy import ElectronMicroscopyExtractor
+from hyperspy.misc.utils import DictionaryTreeBrowser
+
+from scythe.electron_microscopy import DTBView, ElectronMicroscopyExtractor
 from scythe.adapters.base import GreedySerializeAdapter
 
 
@@ -20,6 +22,23 @@ def adapter():
     return GreedySerializeAdapter()
 
 
+def test_dtb_view():
+    view = DTBView(DictionaryTreeBrowser({'Microscope Info': 'Titan', 'Stage': {'x': 1.0}}))
+    assert view['Microscope Info'] == 'Titan'
+    assert isinstance(view['Stage'], DTBView)
+    assert view['Stage']['x'] == 1.0
+
+    # methods of the tree are not items
+    assert 'keys' not in view
+    assert view.get('copy') is None
+    with pytest.raises(KeyError):
+        view['as_dictionary']
+
+    # iteration gives the names under which the tree stores the keys
+    assert list(view) == ['Microscope_Info', 'Stage']
+    assert len(view) == 2
+
+
 def test_dm3(parser, adapter):
     res = parser.extract([file_path('test-1.dm3')])
     assert res['electron_microscopy']['General'] == {
@@ -34,6 +53,19 @@ def test_dm3(parser, adapter):
     assert adapter.transform(res)
 
 
+def test_raw_metadata(parser):
+    assert 'raw_metadata' not in parser.extract([file_path('test-1.dm3')])['electron_microscopy']
+
+    parser = ElectronMicroscopyExtractor(include_raw_metadata=True)
+    res = parser.extract([file_path('test-1.dm3')])
+    assert 'ImageList' in res['electron_microscopy']['raw_metadata']
+    assert jsonschema.validate(res, parser.schema) is None
+
+    # the context takes precedence over the constructor
+    res = parser.extract([file_path('test-1.dm3')], {'include_raw_metadata': False})
+    assert 'raw_metadata' not in res['electron_microscopy']
+
+
 def test_dm4(parser, adapter):
     res = parser.extract([file_path('test-1.dm4')])
     assert res['electron_microscopy']['General'] == {
@@ -666,6 +698,19 @@ def test_zeiss_sem_bad_mag_tif(parser, adapter):
     assert adapter.transform(res)
 
 
+def test_extract_directory_threaded(parser):
+    # the extractor keeps the file being parsed on the instance, which threads must not share
+    directory = str(file_path(''))
+    serial = list(parser.extract_directory(directory))
+    assert len(serial) > 1
+    assert list(parser.extract_directory(directory, max_workers=4)) == serial
+
+
+def test_unsupported_extension(parser):
+    with pytest.raises(ValueError):
+        parser.extract([__file__])
+
+
 def test_implementors(parser):
     assert 'Jonathon Gaff <jgaff@uchicago.edu>' in parser.implementors()
     assert 'Joshua Taillon <joshua.taillon@nist.gov>' in parser.implementors()
@@ -1,5 +1,8 @@
-from scythe.file import GenericFileExtractor
+from scythe.file import GenericFileExtractor, _HASHLIB_ALGS
+import jsonschema
+import hashlib
 import pytest
+import gzip
 import os
 
 
@@ -26,13 +29,64 @@ def test_file():
         del expected['mime_type']
         assert output == expected
         assert isinstance(parser.schema, dict)
+        assert jsonschema.validate(output, parser.schema) is None
         pytest.xfail("'data_type' was not present in the parser output, most likely because "
                      "libmagic is not properly installed")
 
     for i in ['JPEG image data', 'density 300x300', 'TIFF image data',
               '1910x1000']:
         assert i in output['data_type']
+    assert jsonschema.validate(output, parser.schema) is None
     del output['data_type']
     del expected['data_type']
     assert output == expected
     assert isinstance(parser.schema, dict)
+
+
+def test_magic_matches_from_file(tmp_path):
+    magic = pytest.importorskip('magic')
+
+    # libmagic checks the size of empty files and the trailer of gzip files, so the results
+    #  only match if it sees the whole file rather than its first few bytes
+    empty = tmp_path / 'empty'
+    empty.write_bytes(b'')
+    compressed = tmp_path / 'data.gz'
+    compressed.write_bytes(gzip.compress(os.urandom(2 << 20)))
+
+    parser = GenericFileExtractor()
+    for path in [str(empty), str(compressed)]:
+        output = parser.extract([path])
+        assert output['mime_type'] == magic.from_file(path, mime=True)
+        assert output['data_type'] == magic.from_file(path)
+
+
+def test_blake3():
+    pytest.importorskip('blake3')
+    my_file = os.path.join(os.path.dirname(__file__), 'data', 'image', 'dog2.jpeg')
+    parser = GenericFileExtractor(hash_alg='blake3')
+    output = parser.extract([my_file])
+    assert 'sha512' not in output
+    assert len(output['blake3']) == 64
+    assert jsonschema.validate(output, parser.schema) is None
+
+    with pytest.raises(ValueError):
+        GenericFileExtractor(hash_alg='md4')
+
+
+def test_hashlib_alg():
+    my_file = os.path.join(os.path.dirname(__file__), 'data', 'image', 'dog2.jpeg')
+    parser = GenericFileExtractor(hash_alg='sha256')
+    output = parser.extract([my_file])
+    assert 'sha512' not in output
+    with open(my_file, 'rb') as fp:
+        assert output['sha256'] == hashlib.sha256(fp.read()).hexdigest()
+    assert jsonschema.validate(output, parser.schema) is None
+
+    # The schema describes the digest of every algorithm that can be selected
+    for hash_alg in _HASHLIB_ALGS | {'blake3'}:
+        assert hash_alg in parser.schema['properties']
+
+
+def test_schema_cached():
+    # The schema is read from disk once and shared by all instances
+    assert GenericFileExtractor().schema is GenericFileExtractor(hash_alg='sha256').schema
@@ -1,7 +1,7 @@
 from scythe.utils.interface import (get_available_extractors, run_extractor,
                                     get_available_adapters, run_all_extractors_on_directory,
                                     ExtractResult)
-from scythe.utils import set_nested_dict_value
+from scythe.utils import set_nested_dict_value, map_dict_values, get_nested_dict_value_by_path
 from scythe.image import ImageExtractor
 import pytest
 import json
@@ -118,3 +118,47 @@ def test_set_nested_dict():
             'key2.2': 'val2.2'},
         'key3': {'key3.1': 5}
     }
+
+
+def test_get_nested_dict_empty():
+    nest_dict = {'a': {'b': {}, 'c': [], 'd': '', 'e': 0, 'f': False},
+                 'big': {str(i): i for i in range(1000)}}
+
+    # empty containers and strings are treated as missing, but falsy scalars are not
+    for key in 'bcd':
+        assert get_nested_dict_value_by_path(nest_dict, ('a', key)) is None
+    assert get_nested_dict_value_by_path(nest_dict, ('a', 'e')) == 0
+    assert get_nested_dict_value_by_path(nest_dict, ('a', 'f')) is False
+    assert get_nested_dict_value_by_path(nest_dict, ('a', 'missing')) is None
+
+    # non-empty containers are returned as is
+    assert get_nested_dict_value_by_path(nest_dict, 'big') is nest_dict['big']
+
+
+def test_map_dict_values():
+    source = {'a': {'b': '1.5'}, 'c': ''}
+    dest = {'x': {'y': {'value': 2}}}
+    mapping = [
+        {'source_dict': source, 'source_path': ('a', 'b'), 'dest_dict': dest,
+         'dest_path': ('x', 'z'), 'cast_fn': float, 'units': 'MilliM',
+         'conv_fn': lambda v: v * 2, 'override': False},
+        {'source_dict': source, 'source_path': ('a', 'b'), 'dest_dict': dest,
+         'dest_path': ('x', 'y'), 'override': False},
+        {'source_dict': source, 'source_path': 'c', 'dest_dict': dest,
+         'dest_path': ('w',), 'override': True},
+    ]
+    map_dict_values(mapping)
+    assert dest == {'x': {'y': {'value': 2}, 'z': {'value': 3.0, 'units': 'MilliM'}}}
+    assert 'cast_fn' not in mapping[1]  # mapping entries are left untouched
+
+    # paths may be given as lists
+    list_dest = {}
+    map_dict_values([{'source_dict': {'x': {'y': 2}}, 'source_path': ['x', 'y'],
+                      'dest_dict': list_dest, 'dest_path': ['a', 'c']}])
+    assert list_dest == {'a': {'c': {'value': 2}}}
+
+    # sources are not even read for destinations that are already set
+    calls = []
+    map_dict_values([{'source_dict': source, 'source_path': ('a', 'b'), 'dest_dict': dest,
+                      'dest_path': ('x', 'y'), 'cast_fn': calls.append}])
+    assert calls == []